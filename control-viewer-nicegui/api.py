@@ -1,7 +1,7 @@
 """
 API router for the Control Viewer application
 """
-from fastapi import APIRouter, HTTPException, Depends, WebSocket, WebSocketDisconnect
+from fastapi import APIRouter, HTTPException, Depends, Query, Response, WebSocket, WebSocketDisconnect
 from typing import List, Dict, Any, Optional
 import asyncio
 import json
@@ -33,11 +33,35 @@ class ConnectionManager:
 
 manager = ConnectionManager()
 
+# Fields the control points list can be sorted by
+SORTABLE_FIELDS = frozenset({'id', 'name', 'type', 'value'})
+
 # Control Points API
 @router.get("/control-points", response_model=List[ControlPoint])
-async def get_control_points():
-    """Get all control points"""
-    return await database.get_all_control_points()
+async def get_control_points(
+    response: Response,
+    offset: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1),
+    sort_by: Optional[str] = Query(None),
+    descending: bool = Query(False)
+):
+    """Get all control points, or one page of them when offset/limit are given, optionally sorted first"""
+    if sort_by is not None and sort_by not in SORTABLE_FIELDS:
+        raise HTTPException(status_code=400, detail=f"Can't sort control points by {sort_by}")
+    
+    points = await database.get_all_control_points()
+    
+    # Report the full count so paginated clients know how many pages there are
+    response.headers["X-Total-Count"] = str(len(points))
+    
+    # Sort before slicing, so each page is a slice of the sorted list; points without the field go last
+    if sort_by is not None:
+        present = [point for point in points if getattr(point, sort_by) is not None]
+        missing = [point for point in points if getattr(point, sort_by) is None]
+        points = sorted(present, key=lambda point: getattr(point, sort_by), reverse=descending) + missing
+    
+    end = None if limit is None else offset + limit
+    return points[offset:end]
 
 @router.get("/control-points/{point_id}", response_model=ControlPoint)
 async def get_control_point(point_id: str):
@@ -47,9 +71,8 @@ async def get_control_point(point_id: str):
         raise HTTPException(status_code=404, detail="Control point not found")
     return point
 
-@router.post("/control-points", response_model=ControlPoint)
-async def create_control_point(point: ControlPoint):
-    """Create a new control point"""
+def prepare_new_point(point: ControlPoint):
+    """Fill in the timestamp and status of a point about to be created, if they weren't provided"""
     # Set timestamp if not provided
     if not point.timestamp:
         point.timestamp = datetime.now()
@@ -57,6 +80,32 @@ async def create_control_point(point: ControlPoint):
     # Calculate status if not provided
     if point.status == "unknown" and point.value is not None:
         point.status = calculate_status(point)
+
+@router.post("/control-points/bulk", response_model=List[ControlPoint])
+async def create_control_points(points: List[ControlPoint]):
+    """
+    Create many control points in one request, all or nothing.
+    If any point is invalid, the request is rejected with 422 and no point is created;
+    each error's loc gives the index of the point it's about.
+    """
+    for point in points:
+        prepare_new_point(point)
+    
+    created_points = await database.create_control_points(points)
+    
+    # Broadcast all the new points to all connected clients in one message
+    await manager.broadcast(serialize_to_json({
+        "action": "points_delta",
+        "changed": [point.dict() for point in created_points],
+        "removed": []
+    }))
+    
+    return created_points
+
+@router.post("/control-points", response_model=ControlPoint)
+async def create_control_point(point: ControlPoint):
+    """Create a new control point"""
+    prepare_new_point(point)
     
     created_point = await database.create_control_point(point)
     
@@ -212,6 +261,7 @@ async def websocket_endpoint(websocket: WebSocket):
 async def simulate_data():
     """Simulate random changes to control point values for demo purposes"""
     points = await database.get_all_control_points()
+    changed = []
     
     for point in points:
         if point.type == "sensor":  # Only simulate sensor values
@@ -220,24 +270,32 @@ async def simulate_data():
             point.status = calculate_status(point)
             
             await database.update_control_point(point.id, point)
+            changed.append(point.dict())
     
-    # Broadcast updates to all connected clients
+    # Push only the changed points to all connected clients
     await manager.broadcast(serialize_to_json({
-        "action": "simulate",
-        "timestamp": datetime.now().isoformat()
+        "action": "points_delta",
+        "changed": changed,
+        "removed": []
     }))
     
     return {"status": "success", "message": "Simulation completed"}
 
+# Single iteration of the background simulation
+async def _one_simulation_step():
+    """Simulate one round of data changes and return the delay before the next one"""
+    settings = await database.get_system_settings()
+    await simulate_data()
+    return settings.refresh_rate
+
 # Background simulation task
 async def simulation_task():
     """Background task to periodically simulate data changes"""
     while True:
         try:
-            settings = await database.get_system_settings()
             # Simulate data periodically based on refresh rate setting
-            await simulate_data()
-            await asyncio.sleep(settings.refresh_rate)
+            refresh_rate = await _one_simulation_step()
+            await asyncio.sleep(refresh_rate)
         except Exception as e:
             print(f"Error in simulation task: {e}")
             await asyncio.sleep(5)  # Fallback sleep on error
@@ -85,6 +85,13 @@ class MemoryDatabase:
         await self.save_data()
         return point
     
+    async def create_control_points(self, points: List[ControlPoint]) -> List[ControlPoint]:
+        """Create many control points, saving the data once"""
+        for point in points:
+            self.control_points[point.id] = point
+        await self.save_data()
+        return points
+    
     async def update_control_point(self, point_id: str, point: ControlPoint) -> Optional[ControlPoint]:
         """Update an existing control point"""
         if point_id not in self.control_points:
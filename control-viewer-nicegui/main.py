@@ -22,6 +22,13 @@ import uvicorn
 
 from nicegui import ui, app as nicegui_app
 
+# uvloop is optional - it isn't available on Windows
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 
 # Import application components
 from config import settings
@@ -134,7 +141,9 @@ if __name__ in {"__main__", "__mp_main__"}:
     logger.info("=" * 50)
     
     try:
-        logger.info(f"Current event loop: {asyncio.get_event_loop()}")
+        # uvicorn creates the server's event loop; ask for uvloop when it's installed
+        event_loop = "uvloop" if UVLOOP_AVAILABLE else "asyncio"
+        logger.info(f"Event loop: {event_loop}")
 
         ui.run(
             host=settings.HOST,
@@ -143,7 +152,8 @@ if __name__ in {"__main__", "__mp_main__"}:
             dark=False,
             reload=settings.DEBUG,
             storage_secret="control-viewer-secret",
-            show=True
+            show=True,
+            loop=event_loop
         )
     except Exception as e:
         logger.critical(f"Failed to start application: {e}", exc_info=True)
\ No newline at end of file
@@ -4,13 +4,44 @@ Contains shared fixtures and configuration for all tests.
 """
 
 import os
-import sys
 import asyncio
+import hashlib
+import importlib.util
+import inspect
+import shutil
 import pytest
+import orjson
+import numpy as np
+from collections import namedtuple
 from unittest.mock import patch, MagicMock
+from fastapi.testclient import TestClient
 
-# Make sure the application root directory is in the Python path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# uvloop is optional - it isn't available on Windows
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+
+# Column-oriented view of the sample sensors, built from the generated PointSet. Descriptions are
+# dictionary-encoded as indices into quotes, and status is packed into a bitset with one bit per
+# sensor (1 = normal). Unit and type are the same for every sensor and aren't stored. high_outliers
+# and low_outliers hold the indices of the values above 95 and below 5, computed once per frame.
+SensorFrame = namedtuple(
+    "SensorFrame", "values ids timestamps quotes desc_idx status_mask high_outliers low_outliers"
+)
+
+
+def _have_nicegui():
+    """
+    Check whether nicegui is installed, without importing it.
+    """
+    return importlib.util.find_spec("nicegui") is not None
+
+
+# Don't collect the UI tests at all when nicegui isn't installed
+collect_ignore_glob = [] if _have_nicegui() else ["test_ui.py"]
 
 
 def pytest_configure(config):
@@ -22,22 +53,142 @@ def pytest_configure(config):
     # You might want to set other environment variables here
 
 
+def pytest_report_header(config):
+    """
+    Report the JSON parser used for the test fixtures, so CI logs show which backend ran.
+    """
+    return f"json parser: orjson {orjson.__version__}"
+
+
 @pytest.fixture(scope="session")
-def event_loop():
+def event_loop_policy():
     """
-    Create and provide an event loop for async tests.
-    This allows reusing the same event loop for the entire test session.
+    Provide the event loop policy for async tests.
+    Uses uvloop when it's installed, falling back to the default asyncio policy.
+    """
+    if UVLOOP_AVAILABLE:
+        return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
+
+
+@pytest.fixture(scope="session")
+def app():
+    """
+    Provide the FastAPI application.
+    Imported lazily so collection doesn't pay for building the app.
+    """
+    from main import fast_app
+    return fast_app
+
+
+@pytest.fixture(scope="session")
+def generated_points():
+    """
+    Provide the generated 100-point sensor fixture.
+    Built once and cached on disk, so later runs only pay for loading it.
+    """
+    from generate_fixture import load_cached_points
+    return load_cached_points()
+
+
+@pytest.fixture(scope="session")
+def point_set(generated_points):
+    """
+    Provide the generated sensor fixture in column-oriented form, one numpy array per field.
+    """
+    from generate_fixture import PointSet
+    return PointSet.from_records(generated_points)
+
+
+@pytest.fixture(scope="session")
+def sensors(point_set):
     """
+    Provide the sample sensors as frozen, slotted Point records, materialized from the point set.
+    """
+    return point_set.to_points()
+
+
+def make_sensor_frame(point_set):
+    """
+    Build the SensorFrame for a generated point set.
+    Timestamps are parsed into datetime64[ms] once, and the statuses come from the point set's records.
+    """
+    from generate_fixture import TOP_GUN_QUOTES
+    
+    values = point_set.values
+    statuses = [point.status for point in point_set.to_points()]
+    
+    return SensorFrame(
+        values=values,
+        ids=point_set.ids,
+        # numpy datetimes are timezone-naive UTC
+        timestamps=np.char.rstrip(point_set.timestamps, "Z").astype("datetime64[ms]"),
+        quotes=TOP_GUN_QUOTES,
+        desc_idx=point_set.quote_idx,
+        status_mask=np.packbits(np.array(statuses) == "normal"),
+        high_outliers=np.flatnonzero(values > 95),
+        low_outliers=np.flatnonzero(values < 5),
+    )
+
+
+def _publish_sensor_frame(frame, path):
+    """
+    Save each SensorFrame column as an .npy file in the directory path.
+    The directory is renamed into place, so other workers never see a partial frame.
+    """
+    tmp_dir = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_dir.mkdir()
+    for field, column in frame._asdict().items():
+        np.save(tmp_dir / f"{field}.npy", np.asarray(column))
+    
     try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+        os.replace(tmp_dir, path)
+    except OSError:
+        # Another worker published the same frame first
+        shutil.rmtree(tmp_dir)
+
+
+def _map_sensor_frame(path):
+    """
+    Load a published SensorFrame, memory-mapping its columns read-only.
+    """
+    columns = {field: np.load(path / f"{field}.npy", mmap_mode="r") for field in SensorFrame._fields}
+    columns["quotes"] = tuple(columns["quotes"].tolist())
+    return SensorFrame(**columns)
+
+
+@pytest.fixture(scope="session")
+def sensor_frame(pytestconfig, request):
+    """
+    Provide the sample sensors as a SensorFrame of numpy columns, built from the point_set fixture.
+    The columns are also published as .npy files in the pytest cache, keyed on the generated fixture and
+    on make_sensor_frame. Every xdist worker, and every later run, memory-maps the same files instead of
+    building them again, and only a cache miss loads the point set.
+    """
+    # The cache is unavailable when pytest runs with -p no:cacheprovider
+    cache = getattr(pytestconfig, "cache", None)
+    if cache is None:
+        return make_sensor_frame(request.getfixturevalue("point_set"))
     
-    yield loop
+    # The fixture's cache name already changes with the generator and its inputs
+    from generate_fixture import cached_fixture_path
+    key = hashlib.sha256(inspect.getsource(make_sensor_frame).encode())
+    key.update(cached_fixture_path().name.encode())
+    cached_dir = cache.mkdir("sensors") / f"sensors_{key.hexdigest()[:16]}"
+    if not cached_dir.exists():
+        _publish_sensor_frame(make_sensor_frame(request.getfixturevalue("point_set")), cached_dir)
     
-    # Close the event loop at the end of the session
-    loop.close()
+    return _map_sensor_frame(cached_dir)
+
+
+@pytest.fixture(scope="module")
+def test_client(app):
+    """
+    Create a test client for the FastAPI application.
+    Module-scoped so the app lifespan runs once for all tests in a module.
+    """
+    with TestClient(app) as client:
+        yield client
 
 
 @pytest.fixture(autouse=True)
@@ -60,6 +211,15 @@ def mock_ui_components():
         def style(self, *args, **kwargs):
             return self
         
+        def props(self, *args, **kwargs):
+            return self
+        
+        def __enter__(self):
+            return self
+        
+        def __exit__(self, *args):
+            return None
+        
         def on(self, *args, **kwargs):
             return lambda *args, **kwargs: None
     
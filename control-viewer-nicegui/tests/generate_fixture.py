@@ -0,0 +1,256 @@
+"""
+Generator for the 100-point sensor test fixture.
+Creates sensor points covering the last six months with normally distributed values in [0, 100],
+including at least one point greater than 95 and one less than 5.
+
+Run directly to print the fixture as JSON, or pass --golden to rewrite the golden files:
+    python tests/generate_fixture.py [--golden]
+"""
+
+import hashlib
+import os
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import numpy as np
+import orjson
+
+# Number of points in the fixture
+N_POINTS = 100
+
+# Seed for the fixture used by the tests
+SEED = 0xC0FFEE
+
+# Last timestamp in the fixture; fixed so the seeded output is reproducible
+END = datetime(2025, 3, 27, 23, 27, 50, 817000, tzinfo=timezone.utc)
+
+# Generated fixtures are cached here, next to this file
+CACHE_DIR = Path(__file__).parent / "_fixtures"
+
+# Checked-in output of the seeded generator; the indented file is for reading,
+# the compact one is what the tests load
+GOLDEN_PATH = Path(__file__).parent / "fixtures" / f"points_{N_POINTS}.json"
+COMPACT_GOLDEN_PATH = GOLDEN_PATH.with_suffix(".min.json")
+
+# Descriptions are random lines from Top Gun (1986)
+TOP_GUN_QUOTES = (
+    "I feel the need... the need for speed!",
+    "That's right! Ice... man. I am dangerous.",
+    "You can be my wingman anytime.",
+    "Talk to me, Goose.",
+    "The defense department regrets to inform you that your sons are dead because they were stupid.",
+    "Your ego is writing checks your body can't cash.",
+    "Son, your ego is writing checks your body can't cash.",
+    "You've lost that loving feeling.",
+    "That's right! You are dangerous.",
+    "Sorry, Goose, but it's time to buzz the tower.",
+    "I was inverted.",
+    "No. No, Mav, this is not a good idea.",
+    "Maverick, it's not your flying, it's your attitude.",
+    "Great balls of fire!",
+    "Gentleman, this is your first hop. The jet will go Mach 2 with your hair on fire.",
+    "This is what I call a target-rich environment.",
+    "That's a negative, Ghost Rider, the pattern is full.",
+    "Just want to serve my country, be the best pilot in the Navy, sir.",
+    "Every time we go up there, it's unsafe.",
+    "Remember, boys, no points for second place.",
+)
+
+# Index of each quote, for dictionary-encoding descriptions
+_QUOTE_INDEX = {quote: i for i, quote in enumerate(TOP_GUN_QUOTES)}
+
+
+# Options used whenever the fixture is written
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY
+
+
+@dataclass(slots=True, frozen=True)
+class Point:
+    """
+    A single sensor point in the fixture, in the same shape as the API's control points.
+    """
+    id: str
+    name: str
+    description: str
+    value: float
+    unit: str
+    min_value: float
+    max_value: float
+    timestamp: str
+    status: str
+    type: str
+
+
+@dataclass(slots=True)
+class PointSet:
+    """
+    Column-oriented form of the fixture: one numpy array per varying field.
+    The unit, range, status and type are the same for every point, so they aren't stored per point.
+    Descriptions are stored as int8 indices into TOP_GUN_QUOTES.
+    """
+    ids: np.ndarray
+    names: np.ndarray
+    quote_idx: np.ndarray
+    values: np.ndarray
+    timestamps: np.ndarray
+
+    def __len__(self):
+        return len(self.ids)
+
+    @classmethod
+    def from_records(cls, records):
+        """
+        Build a point set from loaded fixture records.
+        """
+        return cls(
+            ids=np.array([r["id"] for r in records]),
+            names=np.array([r["name"] for r in records]),
+            quote_idx=np.fromiter(
+                (_QUOTE_INDEX[r["description"]] for r in records), dtype=np.int8, count=len(records)
+            ),
+            values=np.fromiter((r["value"] for r in records), dtype=np.float64, count=len(records)),
+            timestamps=np.array([r["timestamp"] for r in records]),
+        )
+
+    def to_points(self):
+        """
+        Materialize the row-oriented Point records, for writing the fixture as JSON.
+        """
+        return [
+            Point(
+                id=id,
+                name=name,
+                description=description,
+                value=value,
+                unit="°C",
+                min_value=0.0,
+                max_value=100.0,
+                timestamp=timestamp,
+                status="normal",
+                type="sensor",
+            )
+            for id, name, description, value, timestamp in zip(
+                self.ids, self.names, self.descriptions, self.values, self.timestamps
+            )
+        ]
+
+    @property
+    def descriptions(self):
+        """
+        Description strings, materialized from the quote indices.
+        """
+        return [TOP_GUN_QUOTES[i] for i in self.quote_idx.tolist()]
+
+
+def generate_point_set(n=N_POINTS, seed=None, end=END):
+    """
+    Generate a point set of n sensors evenly spread over the six months before end.
+    Values are drawn in one batch from a normal distribution (mean 50, stddev 15) and clipped to [0, 100].
+    Every random draw comes from a single SFC64 generator, so a given seed always yields the same points.
+    """
+    rng = np.random.Generator(np.random.SFC64(seed))
+    start = end - timedelta(days=182)
+
+    # Normally distributed values, clipped to the sensor range
+    values = rng.standard_normal(n) * 15 + 50
+    np.clip(values, 0, 100, out=values)
+
+    # Ensure we have at least one point > 95 and one point < 5, drawing both values in one batch
+    out_of_band = rng.choice(n, 2, replace=False)
+    values[out_of_band] = np.array([95.1, 0.0]) + rng.random(2) * 4.9
+
+    # Format values to one decimal place
+    values = np.round(values, 1)
+
+    # Timestamps evenly distributed across the six months, formatted in one pass
+    span_us = (end - start) // timedelta(microseconds=1)
+    start_us = np.datetime64(start.astimezone(timezone.utc).replace(tzinfo=None), "us")
+    timestamps = start_us + np.linspace(0, span_us, n, dtype=np.int64).astype("timedelta64[us]")
+    timestamps = np.datetime_as_string(timestamps, unit="ms", timezone="UTC", casting="unsafe")
+    names = np.char.add("foo", timestamps)
+
+    # A random Top Gun quote for each point, as an index into TOP_GUN_QUOTES
+    quote_idx = rng.integers(0, len(TOP_GUN_QUOTES), size=n, dtype=np.int8)
+
+    ids = np.char.add("sensor-", np.char.zfill(np.arange(1, n + 1).astype(str), 3))
+
+    return PointSet(ids=ids, names=names, quote_idx=quote_idx, values=values, timestamps=timestamps)
+
+
+def generate_points(n=N_POINTS, seed=None, end=END):
+    """
+    Generate n sensor points as Point records.
+    """
+    return generate_point_set(n, seed, end).to_points()
+
+
+def count_out_of_band(values, low=5.0, high=95.0):
+    """
+    Count the values above high and below low, as a (high, low) tuple.
+    """
+    return int(np.count_nonzero(values > high)), int(np.count_nonzero(values < low))
+
+
+def dump_points(points, compact=False):
+    """
+    Serialize points to JSON bytes, indented unless compact is set.
+    orjson handles the dataclasses and numpy scalars natively.
+    """
+    option = ORJSON_OPTIONS if compact else ORJSON_OPTIONS | orjson.OPT_INDENT_2
+    return orjson.dumps(points, option=option)
+
+
+def load_points(path):
+    """
+    Load a JSON fixture file as a list of dicts.
+    """
+    return orjson.loads(Path(path).read_bytes())
+
+
+def cached_fixture_path(seed=SEED, n=N_POINTS, cache_dir=CACHE_DIR):
+    """
+    Path of the cached fixture for these generator inputs.
+    The name is keyed on a hash of the inputs and of this generator's source,
+    so changing either regenerates the fixture.
+    """
+    key = hashlib.blake2b(f"{seed}|{len(TOP_GUN_QUOTES)}|{n}|{END.isoformat()}".encode())
+    key.update(Path(__file__).read_bytes())
+    key = key.hexdigest()[:16]
+    return Path(cache_dir) / f"points_{n}_{key}.json"
+
+
+def load_cached_points(seed=SEED, n=N_POINTS, cache_dir=CACHE_DIR):
+    """
+    Load the generated fixture from the disk cache, generating and caching it on a miss.
+    """
+    path = cached_fixture_path(seed, n, cache_dir)
+    if path.exists():
+        return load_points(path)
+
+    blob = dump_points(generate_points(n, seed), compact=True)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Write to a temporary file first so parallel workers never read a partial fixture
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp_path.write_bytes(blob)
+    os.replace(tmp_path, path)
+
+    return orjson.loads(blob)
+
+
+if __name__ == "__main__":
+    point_set = generate_point_set(seed=SEED)
+    points = point_set.to_points()
+    blob = dump_points(points)
+    if "--golden" in sys.argv[1:]:
+        GOLDEN_PATH.write_bytes(blob)
+        COMPACT_GOLDEN_PATH.write_bytes(dump_points(points, compact=True))
+    else:
+        sys.stdout.buffer.write(blob + b"\n")
+
+    # Count points outside normal range as validation
+    high_count, low_count = count_out_of_band(point_set.values)
+    print(f"Points > 95: {high_count}")
+    print(f"Points < 5: {low_count}")
@@ -5,12 +5,8 @@ Tests that configuration is loaded correctly and affects the application behavio
 
 import pytest
 import os
-import sys
 from unittest.mock import patch, MagicMock
 
-# Add the parent directory to the path so we can import the needed modules
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
 # Try to import the config module
 try:
     from config import settings
@@ -5,15 +5,11 @@ Tests the interaction between the application and the database layer.
 
 import pytest
 import os
-import sys
 import asyncio
 from unittest.mock import patch, MagicMock, AsyncMock
 import json
 from datetime import datetime, timedelta
 
-# Add the parent directory to the path so we can import the needed modules
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
 # Import database module - handle import errors gracefully
 try:
     import database
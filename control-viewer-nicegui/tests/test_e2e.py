@@ -6,15 +6,11 @@ Most of these tests are marked as skipped by default because they require a live
 
 import pytest
 import os
-import sys
 import time
 import requests
 import json
 from unittest.mock import patch
 
-# Add the parent directory to the path so we can import the needed modules
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
 # Try to import configuration
 try:
     from config import settings
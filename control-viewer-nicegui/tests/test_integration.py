@@ -4,21 +4,19 @@ Tests the FastAPI endpoints and NiceGUI interface.
 """
 
 import os
-import sys
 import pytest
 import asyncio
-from fastapi.testclient import TestClient
-from httpx import AsyncClient
+import inspect
+import orjson
+from httpx import AsyncClient, ASGITransport
 import logging
-from unittest.mock import patch, MagicMock
-
-# Add the parent directory to the path so we can import the main module
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from unittest.mock import patch, MagicMock, AsyncMock
 
 # Import the FastAPI application and other needed components
-from main import fast_app, nicegui_app
+from main import fast_app, nicegui_app, lifespan, index, about
 from config import settings
 from database import database
+from models import ControlPoint
 
 
 # Configure test logger
@@ -27,21 +25,21 @@ logger = logging.getLogger(__name__)
 
 
 @pytest.fixture
-def test_client():
+async def async_client(app):
     """
-    Create a test client for the FastAPI application.
+    Create an async test client for the FastAPI application.
     """
-    with TestClient(fast_app) as client:
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
         yield client
 
 
-@pytest.fixture
-async def async_client():
+@pytest.fixture(params=["test_client", "async_client"])
+def any_client(request):
     """
-    Create an async test client for the FastAPI application.
+    Provide the sync and the async test client in turn.
+    Resolved during setup, since async fixtures can't be requested from a running test.
     """
-    async with AsyncClient(app=fast_app, base_url="http://test") as client:
-        yield client
+    return request.getfixturevalue(request.param)
 
 
 @pytest.fixture(scope="module", autouse=True)
@@ -90,26 +88,124 @@ class TestFastAPIEndpoints:
     Test FastAPI endpoints.
     """
     
-    def test_health_check(self, test_client):
+    async def test_health_check(self, any_client):
         """
-        Test the health check endpoint.
+        Test the health check endpoint with both the sync and async clients.
         """
-        response = test_client.get("/health")
+        if inspect.iscoroutinefunction(any_client.get):
+            response = await any_client.get("/health")
+        else:
+            response = any_client.get("/health")
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "healthy"
         assert data["app"] == settings.APP_NAME
         assert data["version"] == settings.APP_VERSION
     
-    async def test_health_check_async(self, async_client):
+    async def test_control_points_pagination(self, async_client):
         """
-        Test the health check endpoint using an async client.
+        Test that the control points endpoint returns the requested page and the total count.
         """
-        response = await async_client.get("/health")
+        points = [
+            ControlPoint(id=f"sensor-{i:03d}", name=f"Sensor {i}", status="normal", type="sensor")
+            for i in range(1, 8)
+        ]
+        
+        with patch('api.database.get_all_control_points', AsyncMock(return_value=points)):
+            page = await async_client.get("/control-points", params={"offset": 5, "limit": 5})
+            first_page = await async_client.get("/control-points", params={"limit": 3})
+            past_end = await async_client.get("/control-points", params={"offset": 10, "limit": 5})
+            everything = await async_client.get("/control-points")
+        
+        # Check that only the last two points come back, with the full count in the header
+        assert page.status_code == 200
+        assert [point["id"] for point in page.json()] == ["sensor-006", "sensor-007"]
+        assert page.headers["x-total-count"] == "7"
+        
+        # Check that a limit without an offset starts from the first point
+        assert [point["id"] for point in first_page.json()] == ["sensor-001", "sensor-002", "sensor-003"]
+        assert first_page.headers["x-total-count"] == "7"
+        
+        # Check that an offset past the last point gives an empty page, still with the full count
+        assert past_end.status_code == 200
+        assert past_end.json() == []
+        assert past_end.headers["x-total-count"] == "7"
+        
+        # Check that the unpaginated call still returns every point
+        assert len(everything.json()) == 7
+    
+    async def test_control_points_sorted_page(self, async_client):
+        """
+        Test that the control points are sorted before the requested page is sliced off.
+        """
+        points = [
+            ControlPoint(id=f"sensor-{i:03d}", name=f"Sensor {i}", value=value, status="normal", type="sensor")
+            for i, value in enumerate([30.0, None, 10.0, 50.0, 20.0], start=1)
+        ]
+        
+        with patch('api.database.get_all_control_points', AsyncMock(return_value=points)):
+            ascending = await async_client.get("/control-points", params={"sort_by": "value", "limit": 2})
+            descending = await async_client.get(
+                "/control-points", params={"sort_by": "value", "descending": True, "offset": 2}
+            )
+            unsortable = await async_client.get("/control-points", params={"sort_by": "description"})
+        
+        # Check that each page is a slice of the sorted list, with the point without a value last
+        assert [point["value"] for point in ascending.json()] == [10.0, 20.0]
+        assert [point["value"] for point in descending.json()] == [20.0, 10.0, None]
+        assert descending.headers["x-total-count"] == "5"
+        
+        # Check that fields the table can't sort by are rejected
+        assert unsortable.status_code == 400
+    
+    async def test_control_points_bulk_create(self, async_client):
+        """
+        Test that the bulk endpoint creates every point in one save and broadcasts them in one message.
+        """
+        points = [
+            {"id": f"sensor-{i:03d}", "name": f"Sensor {i}", "value": 50.0, "min_value": 0, "max_value": 100,
+             "status": "unknown", "type": "sensor"}
+            for i in range(1, 4)
+        ]
+        
+        with patch('api.database.create_control_points', AsyncMock(side_effect=lambda points: points)) as create, \
+                patch('api.manager.broadcast', AsyncMock()) as broadcast:
+            response = await async_client.post("/control-points/bulk", json=points)
+        
+        # Check that all the points were created at once, with their status and timestamp filled in
         assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "healthy"
+        assert [point["id"] for point in response.json()] == ["sensor-001", "sensor-002", "sensor-003"]
+        assert all(point["status"] == "normal" and point["timestamp"] for point in response.json())
+        create.assert_awaited_once()
+        
+        # Check that one points_delta message carried every new point
+        broadcast.assert_awaited_once()
+        message = orjson.loads(broadcast.await_args.args[0])
+        assert message["action"] == "points_delta"
+        assert len(message["changed"]) == 3
 
+    
+    async def test_control_points_bulk_create_rejects_all(self, async_client):
+        """
+        Test that one invalid point rejects the whole bulk request, naming the bad point, and creates nothing.
+        """
+        points = [
+            {"id": f"sensor-{i:03d}", "name": f"Sensor {i}", "value": 50.0, "status": "unknown", "type": "sensor"}
+            for i in range(1, 4)
+        ]
+        points[1]["value"] = "high"
+        
+        with patch('api.database.create_control_points', AsyncMock()) as create, \
+                patch('api.manager.broadcast', AsyncMock()) as broadcast:
+            response = await async_client.post("/control-points/bulk", json=points)
+        
+        # Check that the error points at the second point only
+        assert response.status_code == 422
+        assert {tuple(error["loc"][:2]) for error in response.json()["detail"]} == {("body", 1)}
+        
+        # Check that none of the valid points were saved or broadcast
+        create.assert_not_awaited()
+        broadcast.assert_not_awaited()
 
 class TestLifespanHandling:
     """
@@ -121,8 +217,6 @@ class TestLifespanHandling:
         """
         Test that the lifespan context manager starts up correctly.
         """
-        from main import lifespan
-        
         # Create a mock app for the lifespan
         mock_app = MagicMock()
         
@@ -140,8 +234,6 @@ class TestLifespanHandling:
         """
         Test that simulation is started in debug mode.
         """
-        # Import will trigger lifespan which should start simulation
-        from main import fast_app
         assert mock_simulation.called
 
 
@@ -150,20 +242,6 @@ class TestNiceGUIIntegration:
     Test NiceGUI integration.
     """
     
-    @patch('ui.setup_layout')
-    def test_index_page_renders(self, mock_setup_layout):
-        """
-        Test that the index page renders and calls setup_layout.
-        """
-        # We need to mock the ui.page decorator to capture the function call
-        from main import index
-        
-        # Call the index function directly
-        index()
-        
-        # Verify that setup_layout was called
-        assert mock_setup_layout.called
-    
     def test_about_page_content(self):
         """
         Test that the about page contains expected content.
@@ -173,19 +251,7 @@ class TestNiceGUIIntegration:
         # For now, we'll check if the route exists
         
         # Check if the about route exists in nicegui_app
-        from main import about
         assert callable(about)
-    
-    def test_api_mounted_to_nicegui(self):
-        """
-        Test that the FastAPI app is mounted to NiceGUI.
-        """
-        # Check if FastAPI is mounted to /api in nicegui_app
-        assert '/api' in nicegui_app.routes
-        
-        # Additional check to ensure it's our FastAPI app
-        mounted_app = nicegui_app.routes['/api'].app
-        assert mounted_app == fast_app
 
 
 class TestErrorHandling:
@@ -198,8 +264,6 @@ class TestErrorHandling:
         """
         Test that errors in index page rendering are handled properly.
         """
-        from main import index
-        
         # We need to patch ui.card and ui.label to check they're used for error display
         with patch('nicegui.ui.card') as mock_card:
             mock_card.return_value = MagicMock()
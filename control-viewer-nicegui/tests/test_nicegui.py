@@ -4,19 +4,18 @@ Tests the integration between NiceGUI and FastAPI.
 """
 
 import pytest
-import os
-import sys
 from unittest.mock import patch, MagicMock, AsyncMock
 import json
 import asyncio
-
-# Add the parent directory to the path so we can import the needed modules
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import inspect
 
 # Try importing needed modules
 try:
     from nicegui import ui
-    from main import nicegui_app, fast_app
+    from fastapi.routing import APIRoute
+    from starlette.routing import Mount
+    # test_page is aliased so pytest doesn't collect it as a test
+    from main import nicegui_app, fast_app, index, about, test_page as main_test_page
     NICEGUI_AVAILABLE = True
 except ImportError:
     NICEGUI_AVAILABLE = False
@@ -39,42 +38,58 @@ def nicegui_client():
     yield client
 
 
+@pytest.fixture
+def nicegui_ui_mocks():
+    """
+    Patch ui.card and ui.label with mocks that support chained .classes()
+    calls and use as context managers.
+    """
+    with patch('nicegui.ui.card') as mock_card, patch('nicegui.ui.label') as mock_label:
+        mock_card.return_value = MagicMock()
+        mock_card.return_value.classes.return_value = mock_card.return_value
+        mock_card.return_value.__enter__ = lambda x: mock_card.return_value
+        mock_card.return_value.__exit__ = lambda x, y, z, a: None
+        
+        mock_label.return_value = MagicMock()
+        mock_label.return_value.classes.return_value = mock_label.return_value
+        
+        yield mock_card, mock_label
+
+
 @pytest.mark.skipif(not NICEGUI_AVAILABLE, reason="NiceGUI module not available")
 class TestNiceGUISetup:
     """
     Test the NiceGUI setup in the application.
     """
     
-    def test_fastapi_mounted_to_nicegui(self):
+    @pytest.mark.parametrize("path, route_type", [
+        ("/", APIRoute),
+        ("/about", APIRoute),
+        ("/test", APIRoute),
+        ("/api", Mount),
+    ])
+    def test_route_registered(self, path, route_type):
         """
-        Test that FastAPI app is mounted to NiceGUI correctly.
+        Test that UI pages and the FastAPI mount are registered correctly.
         """
-        # Check that FastAPI app is mounted at /api
-        assert '/api' in nicegui_app.routes
+        routes = {route.path: route for route in nicegui_app.routes}
         
-        # Check that it's the right app
-        mounted_app = nicegui_app.routes['/api'].app
-        assert mounted_app == fast_app
-    
-    def test_ui_pages_registered(self):
-        """
-        Test that UI pages are registered correctly.
-        """
-        # Check that main routes exist
-        assert '/' in nicegui_app.routes
-        assert '/about' in nicegui_app.routes
-        assert '/test' in nicegui_app.routes
+        # Check that the route exists with the expected type
+        assert path in routes
+        assert isinstance(routes[path], route_type)
+        
+        # Check that the mount serves our FastAPI app
+        if route_type is Mount:
+            assert routes[path].app == fast_app
     
     def test_ui_page_functions_exist(self):
         """
         Test that UI page functions exist.
         """
-        from main import index, about, test_page
-        
         # Check that page functions exist and are callable
         assert callable(index)
         assert callable(about)
-        assert callable(test_page)
+        assert callable(main_test_page)
 
 
 @pytest.mark.skipif(not NICEGUI_AVAILABLE, reason="NiceGUI module not available")
@@ -83,23 +98,13 @@ class TestNiceGUIComponents:
     Test the NiceGUI UI components used in the application.
     """
     
-    @patch('nicegui.ui.card')
-    @patch('nicegui.ui.label')
-    def test_about_page_renders(self, mock_label, mock_card):
+    def test_about_page_renders(self, nicegui_ui_mocks):
         """
         Test that the about page renders correctly.
         """
-        # Configure mocks
-        mock_card.return_value = MagicMock()
-        mock_card.return_value.classes.return_value = mock_card.return_value
-        mock_card.return_value.__enter__ = lambda x: mock_card.return_value
-        mock_card.return_value.__exit__ = lambda x, y, z, a: None
-        
-        mock_label.return_value = MagicMock()
-        mock_label.return_value.classes.return_value = mock_label.return_value
+        mock_card, mock_label = nicegui_ui_mocks
         
         # Call the about page function
-        from main import about
         about()
         
         # Check that the card and labels were created
@@ -107,50 +112,28 @@ class TestNiceGUIComponents:
         assert mock_label.call_count >= 2  # At least app name and description
     
     @pytest.mark.asyncio
-    @patch('nicegui.ui.card')
-    @patch('nicegui.ui.label')
     @patch('ui.setup_layout')
-    async def test_index_page_calls_setup_layout(self, mock_setup_layout, mock_label, mock_card):
+    async def test_index_page_calls_setup_layout(self, mock_setup_layout, nicegui_ui_mocks):
         """
         Test that the index page calls setup_layout.
         """
-        # Configure mocks
-        mock_card.return_value = MagicMock()
-        mock_card.return_value.classes.return_value = mock_card.return_value
-        mock_card.return_value.__enter__ = lambda x: mock_card.return_value
-        mock_card.return_value.__exit__ = lambda x, y, z, a: None
-        
-        mock_label.return_value = MagicMock()
-        mock_label.return_value.classes.return_value = mock_label.return_value
-        
         mock_setup_layout.return_value = None
         
         # Call the index page function
-        from main import index
         index()
         
         # Check that setup_layout was called
         assert mock_setup_layout.called
     
     @pytest.mark.asyncio
-    @patch('nicegui.ui.card')
-    @patch('nicegui.ui.label')
     @patch('ui.setup_layout', side_effect=Exception("Test error"))
-    async def test_index_page_handles_setup_error(self, mock_setup_layout, mock_label, mock_card):
+    async def test_index_page_handles_setup_error(self, mock_setup_layout, nicegui_ui_mocks):
         """
         Test that the index page handles errors in setup_layout.
         """
-        # Configure mocks
-        mock_card.return_value = MagicMock()
-        mock_card.return_value.classes.return_value = mock_card.return_value
-        mock_card.return_value.__enter__ = lambda x: mock_card.return_value
-        mock_card.return_value.__exit__ = lambda x, y, z, a: None
-        
-        mock_label.return_value = MagicMock()
-        mock_label.return_value.classes.return_value = mock_label.return_value
+        mock_card, mock_label = nicegui_ui_mocks
         
         # Call the index page function
-        from main import index
         index()
         
         # Check that the error card was created
@@ -210,11 +193,11 @@ class TestNiceGUIIntegrationWithFastAPI:
             # Get the click handler
             click_handler = mock_button.return_value.on.call_args[0][1]
             
-            # Call the click handler
-            if asyncio.iscoroutinefunction(click_handler):
-                await click_handler()
-            else:
-                click_handler()
+            # Call the click handler, awaiting the result if it's awaitable
+            # (covers async functions as well as AsyncMock handlers)
+            result = click_handler()
+            if inspect.isawaitable(result):
+                await result
             
             # Check that the API function was called
             assert mock_toggle_simulation.called
@@ -5,15 +5,11 @@ These tests check for common security vulnerabilities in the API endpoints.
 
 import pytest
 import os
-import sys
 import requests
 import json
 import re
 from urllib.parse import urljoin
 
-# Add the parent directory to the path so we can import the needed modules
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
 # Try to import configuration
 try:
     from config import settings
@@ -21,6 +17,9 @@ try:
 except ImportError:
     CONFIG_AVAILABLE = False
 
+# Keep the tests that hit the running server's port on a single xdist worker
+pytestmark = pytest.mark.xdist_group("security")
+
 
 @pytest.fixture
 def app_url():
@@ -268,6 +267,19 @@ import time
 import socket
 import ssl
 
+
+@pytest.fixture(scope="session")
+def strict_ssl_ctx():
+    """
+    Create an SSL context with high security settings.
+    The context isn't modified after creation, so one instance is shared by all tests.
+    """
+    context = ssl.create_default_context()
+    context.check_hostname = True
+    context.verify_mode = ssl.CERT_REQUIRED
+    context.options |= ssl.OP_NO_TLSv1 | ssl.OP_NO_TLSv1_1  # Disable TLS 1.0 and 1.1
+    return context
+
 @pytest.mark.skipif(not os.environ.get("RUN_SECURITY"), reason="Security tests require RUN_SECURITY=1")
 class TestNetworkSecurity:
     """
@@ -290,7 +302,7 @@ class TestNetworkSecurity:
         assert response.status_code in (301, 302, 307, 308)
         assert response.headers.get("Location", "").startswith("https://")
     
-    def test_ssl_configuration(self, app_url):
+    def test_ssl_configuration(self, app_url, strict_ssl_ctx):
         """
         Test SSL configuration if HTTPS is used.
         """
@@ -304,20 +316,11 @@ class TestNetworkSecurity:
         host = parsed_url.hostname
         port = parsed_url.port or 443
         
-        # Create an SSL context with high security settings
-        context = ssl.create_default_context()
-        context.check_hostname = True
-        context.verify_mode = ssl.CERT_REQUIRED
-        context.options |= ssl.OP_NO_TLSv1 | ssl.OP_NO_TLSv1_1  # Disable TLS 1.0 and 1.1
-        
         try:
-            # Try to connect with secure settings
-            with socket.create_connection((host, port)) as sock:
-                with context.wrap_socket(sock, server_hostname=host) as ssock:
-                    # Check the certificate
-                    cert = ssock.getpeercert()
-                    # Verify hostname matches the certificate
-                    ssl.match_hostname(cert, host)
+            # Try to connect with secure settings, failing fast if the host doesn't answer
+            with socket.create_connection((host, port), timeout=5) as sock:
+                # check_hostname makes the handshake verify the certificate against the host
+                with strict_ssl_ctx.wrap_socket(sock, server_hostname=host) as ssock:
                     # Check SSL version
                     assert ssock.version() in ("TLSv1.2", "TLSv1.3")
         except ssl.SSLError as e:
@@ -4,24 +4,38 @@ Tests the simulation components that generate test data.
 """
 
 import pytest
-import os
-import sys
 import asyncio
+import numpy as np
+from types import MappingProxyType
 from unittest.mock import patch, MagicMock, AsyncMock
-import time
 
-# Add the parent directory to the path so we can import the needed modules
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from models import ControlPoint, SystemSettings
+
+import api
+import utils
+
+# The api module can start the simulation, but can't stop or toggle it yet
+SIMULATION_CONTROL_AVAILABLE = all(
+    hasattr(api, name) for name in ("stop_simulation", "toggle_simulation", "SIMULATION_RUNNING")
+)
 
-# Import simulation-related modules
 try:
-    from api import start_simulation, stop_simulation, toggle_simulation
-    SIMULATION_AVAILABLE = True
+    from api import generate_sensor_status
+    SENSOR_STATUS_AVAILABLE = True
 except ImportError:
-    SIMULATION_AVAILABLE = False
+    SENSOR_STATUS_AVAILABLE = False
 
+# Sensor records returned by the mocked database, shared read-only; each call builds fresh points
+# from them, since the simulation updates the points it's given in place
+_SENSORS = (
+    MappingProxyType({"id": "sensor-001", "name": "Test Sensor 1", "value": 25.0, "unit": "°C",
+                      "min_value": 0.0, "max_value": 100.0, "status": "normal", "type": "sensor"}),
+    MappingProxyType({"id": "sensor-002", "name": "Test Sensor 2", "value": 50.0, "unit": "°C",
+                      "min_value": 0.0, "max_value": 100.0, "status": "normal", "type": "sensor"}),
+)
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def mock_simulation_task():
     """
     Mock the simulation task
@@ -31,24 +45,40 @@ def mock_simulation_task():
         yield mock_task
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_database():
     """
     Mock the database module
     """
     with patch('api.database') as mock_db:
-        mock_db.update_sensor = MagicMock()
-        mock_db.get_all_sensors = MagicMock(return_value=[
-            {"id": "sensor-001", "name": "Test Sensor 1", "value": 25.0, "status": "normal"},
-            {"id": "sensor-002", "name": "Test Sensor 2", "value": 50.0, "status": "normal"}
-        ])
+        # Set as soon as the first point update happens, so tests can wait on it
+        mock_db.sensor_updated = asyncio.Event()
+        mock_db.update_control_point = AsyncMock(side_effect=lambda *args, **kwargs: mock_db.sensor_updated.set())
+        mock_db.get_all_control_points = AsyncMock(side_effect=lambda: [ControlPoint(**s) for s in _SENSORS])
+        mock_db.get_system_settings = AsyncMock(return_value=SystemSettings())
         yield mock_db
 
 
-@pytest.mark.skipif(not SIMULATION_AVAILABLE, reason="Simulation module not available")
+@pytest.fixture(autouse=True)
+def reset_simulation_mocks(request):
+    """
+    Reset call state on the module-scoped mocks before each test that uses them.
+    Configured return values are kept.
+    """
+    for name in ("mock_simulation_task", "mock_database"):
+        if name in request.fixturenames:
+            request.getfixturevalue(name).reset_mock()
+    if "mock_database" in request.fixturenames:
+        request.getfixturevalue("mock_database").sensor_updated.clear()
+    yield
+
+
+@pytest.mark.skipif(not SIMULATION_CONTROL_AVAILABLE, reason="Simulation stop/toggle not available in api module")
+@pytest.mark.xdist_group("api_globals")
 class TestSimulationControl:
     """
     Test the simulation control functions.
+    These all read or write api.SIMULATION_RUNNING, so they run on one xdist worker.
     """
     
     def test_start_simulation(self, mock_simulation_task):
@@ -56,7 +86,7 @@ class TestSimulationControl:
         Test starting the simulation.
         """
         # Call the function
-        result = start_simulation()
+        result = api.start_simulation()
         
         # Check the result
         assert result["status"] == "started"
@@ -68,14 +98,13 @@ class TestSimulationControl:
         Test stopping the simulation.
         """
         # Call the function
-        result = stop_simulation()
+        result = api.stop_simulation()
         
         # Check the result
         assert result["status"] == "stopped"
         
         # Check that the simulation flag was changed
-        from api import SIMULATION_RUNNING
-        assert not SIMULATION_RUNNING
+        assert not api.SIMULATION_RUNNING
     
     @patch('api.SIMULATION_RUNNING', False)
     def test_toggle_simulation_start(self, mock_simulation_task):
@@ -83,7 +112,7 @@ class TestSimulationControl:
         Test toggling the simulation from stopped to started.
         """
         # Call the function
-        result = toggle_simulation()
+        result = api.toggle_simulation()
         
         # Check the result
         assert result["status"] == "started"
@@ -95,211 +124,118 @@ class TestSimulationControl:
         Test toggling the simulation from started to stopped.
         """
         # Call the function
-        result = toggle_simulation()
+        result = api.toggle_simulation()
         
         # Check the result
         assert result["status"] == "stopped"
         
         # Check that the simulation flag was changed
-        from api import SIMULATION_RUNNING
-        assert not SIMULATION_RUNNING
+        assert not api.SIMULATION_RUNNING
 
 
-@pytest.mark.skipif(not SIMULATION_AVAILABLE, reason="Simulation module not available")
 class TestSimulationTask:
     """
     Test the simulation task that generates data.
     """
     
-    @pytest.mark.asyncio
-    async def test_simulation_task_updates_sensors(self, mock_database):
+    async def test_simulation_step_updates_sensors(self, mock_database):
         """
-        Test that the simulation task updates sensor values.
+        Test that one simulation step updates every sensor and returns the configured refresh rate.
         """
-        # Import the simulation task directly
-        try:
-            from api import simulation_task
-            
-            # Set up the simulation to run briefly
-            from api import SIMULATION_RUNNING
-            
-            # Create a wrapper to run the task for a short time
-            async def run_simulation():
-                # Set the simulation to running
-                api.SIMULATION_RUNNING = True
-                
-                # Run the task in the background
-                task = asyncio.create_task(simulation_task())
-                
-                # Let it run briefly
-                await asyncio.sleep(0.2)
-                
-                # Stop the simulation
-                api.SIMULATION_RUNNING = False
-                
-                # Wait for the task to complete
-                try:
-                    await asyncio.wait_for(task, timeout=0.5)
-                except asyncio.TimeoutError:
-                    # Cancel the task if it doesn't complete in time
-                    task.cancel()
-                    try:
-                        await task
-                    except asyncio.CancelledError:
-                        pass
-            
-            # Run the simulation
-            await run_simulation()
-            
-            # Check that the database update function was called
-            assert mock_database.update_sensor.called
-            
-        except ImportError:
-            pytest.skip("simulation_task function not available in api module")
+        refresh_rate = await api._one_simulation_step()
+        
+        # Check that each sensor was saved once, and the delay came from the settings
+        assert mock_database.update_control_point.await_count == len(_SENSORS)
+        assert refresh_rate == SystemSettings().refresh_rate
     
-    @pytest.mark.skipif(True, reason="Long-running test")
-    @pytest.mark.asyncio
-    async def test_simulation_task_long_running(self, mock_database):
+    async def test_simulation_task_updates_sensors(self, mock_database):
         """
-        Test the simulation task over a longer period to ensure it continues to update values.
-        This test is skipped by default as it's long-running.
+        Test that the background simulation task updates sensor values.
         """
-        # Import the simulation task directly
+        # Start the task eagerly so it runs until its first await (Python 3.12+);
+        # the factory is only swapped for this one task
+        loop = asyncio.get_running_loop()
+        previous_factory = loop.get_task_factory()
+        if hasattr(asyncio, "eager_task_factory"):
+            loop.set_task_factory(asyncio.eager_task_factory)
+        
         try:
-            from api import simulation_task
-            
-            # Set up the simulation to run for a longer time
-            from api import SIMULATION_RUNNING
-            
-            # Create a wrapper to run the task for a longer time
-            async def run_simulation_longer():
-                # Set the simulation to running
-                api.SIMULATION_RUNNING = True
-                
-                # Run the task in the background
-                task = asyncio.create_task(simulation_task())
-                
-                # Let it run for a few seconds
-                await asyncio.sleep(5)
-                
-                # Stop the simulation
-                api.SIMULATION_RUNNING = False
-                
-                # Wait for the task to complete
-                try:
-                    await asyncio.wait_for(task, timeout=1)
-                except asyncio.TimeoutError:
-                    # Cancel the task if it doesn't complete in time
-                    task.cancel()
-                    try:
-                        await task
-                    except asyncio.CancelledError:
-                        pass
-            
-            # Run the simulation
-            await run_simulation_longer()
-            
-            # Check that the database update function was called multiple times
-            assert mock_database.update_sensor.call_count > 3
-            
-        except ImportError:
-            pytest.skip("simulation_task function not available in api module")
+            task = asyncio.create_task(api.simulation_task())
+        finally:
+            loop.set_task_factory(previous_factory)
+        
+        # Let it run until the first point update
+        try:
+            await asyncio.wait_for(mock_database.sensor_updated.wait(), timeout=0.5)
+        except asyncio.TimeoutError:
+            # No update happened; the assertion below reports it
+            pass
+        finally:
+            # The task loops forever, so cancel it and wait for it to finish
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        
+        # Check that the simulation saved the updated points
+        assert mock_database.update_control_point.await_count > 0
 
 
-@pytest.mark.skipif(not SIMULATION_AVAILABLE, reason="Simulation module not available")
 class TestSimulationDataGeneration:
     """
     Test the data generation functions used by the simulation.
     """
     
-    def test_generate_random_sensor_value(self):
+    def test_generate_simulated_value(self):
         """
-        Test generating random sensor values.
+        Test that each simulated step stays within its unit's noise width of the previous value.
         """
-        # Try to import the function
-        try:
-            from api import generate_random_sensor_value
-            
-            # Call the function with a base value and range
-            base_value = 50.0
-            value_range = 10.0
-            
-            # Generate several values
-            values = [generate_random_sensor_value(base_value, value_range) for _ in range(10)]
-            
-            # Check that all values are within the expected range
-            for value in values:
-                assert base_value - value_range <= value <= base_value + value_range
-            
-            # Check that we got different values (very unlikely to get all the same)
-            assert len(set(values)) > 1
-            
-        except ImportError:
-            pytest.skip("generate_random_sensor_value function not available in api module")
+        point = ControlPoint(id="sensor-001", name="Test Sensor 1", value=50.0, unit="%",
+                             min_value=0.0, max_value=100.0, status="normal", type="sensor")
+        
+        # Generate enough steps from the same value to exercise the distribution
+        n = 10_000
+        values = np.fromiter((utils.generate_simulated_value(point) for _ in range(n)), dtype=np.float64, count=n)
+        
+        # Check that all values are within the expected range; percentages vary by up to 2 per step
+        assert np.all((values >= 48.0) & (values <= 52.0))
+        
+        # Check that we got different values (very unlikely to get all the same)
+        assert np.unique(values).size > 1
     
-    def test_generate_sensor_status(self):
+    def test_simulated_value_kept_in_bounds(self):
         """
-        Test generating sensor status based on value.
+        Test that a step that would leave the point's range is clamped to it.
         """
-        # Try to import the function
-        try:
-            from api import generate_sensor_status
-            
-            # Call the function with different values
-            normal_value = 50.0
-            warning_value_low = 20.0
-            warning_value_high = 80.0
-            critical_value_low = 5.0
-            critical_value_high = 95.0
-            
-            # Use default min/max for the tests
-            min_value = 0.0
-            max_value = 100.0
-            
-            # Check the statuses
-            assert generate_sensor_status(normal_value, min_value, max_value) == "normal"
-            assert generate_sensor_status(warning_value_low, min_value, max_value) == "warning"
-            assert generate_sensor_status(warning_value_high, min_value, max_value) == "warning"
-            assert generate_sensor_status(critical_value_low, min_value, max_value) == "critical"
-            assert generate_sensor_status(critical_value_high, min_value, max_value) == "critical"
-            
-        except ImportError:
-            pytest.skip("generate_sensor_status function not available in api module")
-
-
-@pytest.mark.skipif(True, reason="System test requiring full application")
-class TestSimulationSystemTests:
-    """
-    System tests for the simulation functionality.
-    These tests require the full application to be running.
-    Skipped by default as they are system tests.
-    """
+        point = ControlPoint(id="sensor-002", name="Test Sensor 2", value=99.5, unit="kPa",
+                             min_value=0.0, max_value=100.0, status="normal", type="sensor")
+        
+        values = [utils.generate_simulated_value(point) for _ in range(1_000)]
+        
+        # Check that no step went past the maximum, though kPa vary by up to 10
+        assert max(values) == 100.0
+        assert min(values) >= 89.5
+    
+    def test_noise_buffer_refilled(self):
+        """
+        Test that the noise buffer is refilled with fresh samples once it runs out.
+        """
+        n = utils.NOISE_BUFFER_SIZE
+        samples = np.array([utils._next_noise() for _ in range(2 * n + 1)])
+        
+        # Check that every sample is in [-1, 1) and that a refill didn't replay the same buffer
+        assert np.all((samples >= -1) & (samples < 1))
+        assert not np.array_equal(samples[:n], samples[n:2 * n])
     
-    def test_simulation_affects_ui(self):
+    @pytest.mark.skipif(not SENSOR_STATUS_AVAILABLE, reason="generate_sensor_status function not available in api module")
+    @pytest.mark.parametrize("value,expected", [
+        (50.0, "normal"),
+        (20.0, "warning"),
+        (80.0, "warning"),
+        (5.0, "critical"),
+        (95.0, "critical"),
+    ])
+    def test_generate_sensor_status(self, value, expected):
         """
-        Test that the simulation affects the UI.
-        This would use Selenium or similar to check the UI updates.
+        Test generating sensor status based on value.
         """
-        # Example using Selenium (not implemented)
-        # from selenium import webdriver
-        # from selenium.webdriver.common.by import By
-        # driver = webdriver.Chrome()
-        # driver.get("http://localhost:8000")
-        # 
-        # # Find and click the simulation toggle button
-        # toggle_button = driver.find_element(By.ID, "simulation-toggle")
-        # toggle_button.click()
-        # 
-        # # Wait for UI to update
-        # time.sleep(2)
-        # 
-        # # Check that sensor values are changing
-        # sensor_value_1 = driver.find_element(By.ID, "sensor-001-value").text
-        # time.sleep(2)
-        # sensor_value_2 = driver.find_element(By.ID, "sensor-001-value").text
-        # 
-        # # Values should be different after simulation runs
-        # assert sensor_value_1 != sensor_value_2
-        # 
-        # driver.quit()
-        pass
\ No newline at end of file
+        # Use default min/max for the tests
+        assert generate_sensor_status(value, 0.0, 100.0) == expected
@@ -0,0 +1,52 @@
+"""
+Browser-based tests for the UI of the Control Viewer application.
+The module is skipped at collection time unless selenium is installed,
+and its tests carry the browser marker so they can be deselected with -m "not browser".
+"""
+
+import pytest
+
+selenium = pytest.importorskip("selenium", reason="browser-based UI tests require selenium")
+
+pytestmark = pytest.mark.browser
+
+
+class TestBrowserBasedUI:
+    """
+    Tests that require a browser to interact with the UI.
+    These tests would typically use Selenium or Playwright.
+    """
+    
+    def test_ui_renders_in_browser(self):
+        """
+        Test that the UI renders correctly in a browser.
+        This would use Selenium or similar to check the rendered UI.
+        """
+        # Example using Selenium (not implemented)
+        # from selenium import webdriver
+        # driver = webdriver.Chrome()
+        # driver.get("http://localhost:8000")
+        # assert "Control Viewer" in driver.title
+        # driver.quit()
+        pass
+    
+    def test_tabs_navigation(self):
+        """
+        Test that tab navigation works correctly.
+        """
+        # Example using Selenium (not implemented)
+        # from selenium import webdriver
+        # from selenium.webdriver.common.by import By
+        # driver = webdriver.Chrome()
+        # driver.get("http://localhost:8000")
+        # 
+        # # Click on Sensors tab
+        # sensors_tab = driver.find_element(By.XPATH, "//div[contains(text(), 'Sensors')]")
+        # sensors_tab.click()
+        # 
+        # # Check that sensors content is visible
+        # sensors_content = driver.find_element(By.ID, "sensors-content")
+        # assert sensors_content.is_displayed()
+        # 
+        # driver.quit()
+        pass
@@ -0,0 +1,219 @@
+"""
+Unit tests for the helpers in the utils module of the Control Viewer application.
+These tests check the status calculation against the original if/elif ladder, and the sample data generator.
+"""
+
+import pytest
+import numpy as np
+from datetime import datetime
+from unittest.mock import MagicMock
+
+# Import utils module - handle import errors gracefully
+try:
+    from models import ControlPoint, PointStatus, PointType
+    import utils
+    from utils import calculate_status, calculate_status_batch, generate_sample_data
+    UTILS_AVAILABLE = True
+except ImportError:
+    UTILS_AVAILABLE = False
+
+pytestmark = pytest.mark.skipif(not UTILS_AVAILABLE, reason="utils module not available")
+
+
+def ladder_status(value, min_value, max_value):
+    """
+    The original calculate_status decision, kept here as the reference the table-driven version must match.
+    """
+    range_size = max_value - min_value
+    warn_low = min_value + range_size * 0.1
+    warn_high = max_value - range_size * 0.1
+    alarm_low = min_value + range_size * 0.05
+    alarm_high = max_value - range_size * 0.05
+    
+    if value <= min_value or value >= max_value:
+        return PointStatus.ERROR
+    if value <= alarm_low or value >= alarm_high:
+        return PointStatus.ALARM
+    if value <= warn_low or value >= warn_high:
+        return PointStatus.WARNING
+    return PointStatus.NORMAL
+
+
+# (value, min_value, max_value) cases covering every band, the exact band edges,
+# values just inside them, ranges whose thresholds aren't exact in binary, and
+# empty and inverted ranges
+STATUS_CASES = [
+    # Range 0..100: error, alarm, warning and normal bands on both sides
+    (-1, 0, 100), (0, 0, 100), (0.001, 0, 100),
+    (5, 0, 100), (5.001, 0, 100), (10, 0, 100), (10.001, 0, 100),
+    (50, 0, 100),
+    (89.999, 0, 100), (90, 0, 100), (94.999, 0, 100), (95, 0, 100),
+    (99.999, 0, 100), (100, 0, 100), (101, 0, 100),
+    # Negative range
+    (-50, -50, -10), (-48, -50, -10), (-46, -50, -10), (-30, -50, -10), (-12, -50, -10),
+    # Thresholds that aren't exact in binary
+    (0.1 + 0.6 * 0.05, 0.1, 0.7), (0.1 + 0.6 * 0.1, 0.1, 0.7), (0.4, 0.1, 0.7),
+    (0.7 - 0.6 * 0.1, 0.1, 0.7), (0.7 - 0.6 * 0.05, 0.1, 0.7),
+    # Empty range
+    (4, 5, 5), (5, 5, 5), (6, 5, 5),
+    # Inverted range
+    (-1, 10, 0), (0, 10, 0), (5, 10, 0), (10, 10, 0), (11, 10, 0),
+]
+
+
+def make_point(value, min_value, max_value):
+    """
+    Build a control point with the given value and limits.
+    """
+    return ControlPoint(
+        id="status-test",
+        name="Status Test",
+        value=value,
+        min_value=min_value,
+        max_value=max_value,
+        status=PointStatus.UNKNOWN,
+        type=PointType.SENSOR,
+    )
+
+
+class TestCalculateStatus:
+    """
+    Test calculate_status against the original ladder.
+    """
+    
+    @pytest.mark.parametrize("value,min_value,max_value", STATUS_CASES)
+    def test_matches_ladder(self, value, min_value, max_value):
+        """
+        Test that calculate_status gives the same status as the original ladder.
+        """
+        point = make_point(value, min_value, max_value)
+        
+        # Check the status against the reference
+        assert calculate_status(point) == ladder_status(value, min_value, max_value)
+    
+    @pytest.mark.parametrize("value,min_value,max_value", [
+        (None, 0, 100), (50, None, 100), (50, 0, None),
+    ])
+    def test_missing_values_unknown(self, value, min_value, max_value):
+        """
+        Test that a point missing its value or a limit has an unknown status.
+        """
+        point = make_point(value, min_value, max_value)
+        
+        # Check that no status could be calculated
+        assert calculate_status(point) == PointStatus.UNKNOWN
+    
+    @pytest.mark.parametrize("min_value,max_value", [(5, 5), (10, 0)])
+    def test_empty_range_always_error(self, min_value, max_value):
+        """
+        Test that every value is an error for an empty or inverted range.
+        """
+        for value in (-100, min_value, (min_value + max_value) / 2, max_value, 100):
+            point = make_point(value, min_value, max_value)
+            
+            # Check that the value is out of range
+            assert calculate_status(point) == PointStatus.ERROR
+
+
+class TestCalculateStatusBatch:
+    """
+    Test calculate_status_batch against calculate_status and the original ladder.
+    """
+    
+    @pytest.mark.parametrize("value,min_value,max_value", STATUS_CASES)
+    def test_matches_ladder(self, value, min_value, max_value):
+        """
+        Test that a single-point batch gives the same status as the original ladder.
+        """
+        statuses = calculate_status_batch(np.array([value]), np.array([min_value]), np.array([max_value]))
+        
+        # Check the status against the reference
+        assert statuses == [ladder_status(value, min_value, max_value)]
+    
+    def test_matches_calculate_status(self):
+        """
+        Test that one batch over every case matches calculate_status point by point.
+        """
+        values, mins, maxs = (np.array(column, dtype=np.float64) for column in zip(*STATUS_CASES))
+        
+        statuses = calculate_status_batch(values, mins, maxs)
+        
+        # Check every point against the scalar version
+        expected = [calculate_status(make_point(*case)) for case in STATUS_CASES]
+        assert statuses == expected
+    
+    def test_empty_batch(self):
+        """
+        Test that an empty batch gives no statuses.
+        """
+        assert calculate_status_batch(np.array([]), np.array([]), np.array([])) == []
+
+
+class StubGenerator:
+    """
+    Stand-in for utils' random generator that returns fixed type indices, unit indices and values.
+    """
+    
+    def __init__(self, types, units, values):
+        self.draws = [np.array(types), np.array(units)]
+        self.values = np.array(values, dtype=np.float64)
+    
+    def integers(self, low, high, size):
+        return self.draws.pop(0)
+    
+    def uniform(self, low, high):
+        return self.values
+
+
+class TestGenerateSampleData:
+    """
+    Test the vectorized sample data generator.
+    """
+    
+    def test_alarm_band_reachable(self, monkeypatch):
+        """
+        Test that values in the alarm band get the alarm status, not the wider warning band's.
+        """
+        # Percentages, whose range is 0 to 100: alarm below 5 or above 95, warning below 10 or above 90
+        percent = utils.SAMPLE_UNITS.index("%")
+        values = [3.0, 97.0, 7.0, 92.0, 50.0]
+        monkeypatch.setattr(utils, "_rng", StubGenerator([0] * 5, [percent] * 5, values))
+        
+        points = generate_sample_data(5)
+        
+        # Check each point's status; status code 2 is the alarm status
+        assert utils._SAMPLE_STATUSES[2] == PointStatus.ALARM
+        assert [point.status for point in points] == [
+            PointStatus.ALARM, PointStatus.ALARM, PointStatus.WARNING, PointStatus.WARNING, PointStatus.NORMAL,
+        ]
+        
+        # Check that the generator agrees with calculate_status away from the band edges
+        assert [point.status for point in points] == [calculate_status(point) for point in points]
+    
+    def test_output_shape(self):
+        """
+        Test that one call generates the requested number of well-formed points.
+        """
+        points = generate_sample_data(25)
+        
+        # Check the count, that ids are unique, and that each point is drawn from the sample tables
+        assert len(points) == 25
+        assert len({point.id for point in points}) == 25
+        for point in points:
+            assert point.type in utils.SAMPLE_POINT_TYPES
+            assert point.unit in utils.SAMPLE_UNITS
+            assert point.min_value <= point.value <= point.max_value
+    
+    def test_single_clock_read(self, monkeypatch):
+        """
+        Test that every point of a call shares one timestamp from a single clock read.
+        """
+        fake_datetime = MagicMock(wraps=datetime)
+        fake_datetime.now.return_value = datetime(2024, 9, 27, 23, 27, 50)
+        monkeypatch.setattr(utils, "datetime", fake_datetime)
+        
+        points = generate_sample_data(10)
+        
+        # Check that the clock was read once and its reading stamped on every point
+        fake_datetime.now.assert_called_once_with()
+        assert {point.timestamp for point in points} == {datetime(2024, 9, 27, 23, 27, 50)}
@@ -2,31 +2,181 @@
 UI module for the Control Viewer application using NiceGUI
 """
 from nicegui import ui, app
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from types import MappingProxyType
 import asyncio
-import json
+import contextlib
+import sys
+import zlib
 from typing import Dict, List, Any, Callable, Optional
 from models import ControlPoint, ControlGroup, SystemSettings, PointStatus
 
 import httpx
+import numpy as np
+import orjson
 import websockets
 
+# ciso8601 is optional - it parses ISO 8601 timestamps much faster than datetime.fromisoformat
+try:
+    from ciso8601 import parse_datetime_as_naive
+except ImportError:
+    parse_datetime_as_naive = None
+
 import time
+import traceback
 
 from config import settings
 
 API_BASE_URL = f'http://{settings.HOST}:{settings.PORT}/api'
 
+# Fields that change a control card's layout; a change to any of them rebuilds the card
+CARD_LAYOUT_FIELDS = ('name', 'description', 'type', 'unit', 'min_value', 'max_value')
+
+# Rows per page of the control points table; each page is fetched from the API when it's shown
+TABLE_ROWS_PER_PAGE = 50
+
+# Seconds between the dashboard's periodic refreshes while the WebSocket is down;
+# clicks on Refresh are only held to UIState.refresh_cooldown
+DASHBOARD_POLL_INTERVAL = 10
+
+# Trend refresh requests arriving within this many seconds are coalesced into one refresh
+TREND_REFRESH_DEBOUNCE = 0.3
+
+# GET responses are reused for this many seconds, so a burst of refreshes makes one round trip
+GET_CACHE_TTL = 0.5
+
+# Points pushed over the WebSocket within this many seconds are applied to the dashboard in one render
+POINTS_DELTA_DEBOUNCE = 0.1
+
+# WebSocket message actions that change the dashboard's points
+_POINT_ACTIONS = frozenset({'points_delta', 'create', 'update', 'delete'})
+
+# Trend line colors, picked per point by get_random_color
+_COLORS = (
+    'rgb(54, 162, 235)',   # blue
+    'rgb(255, 99, 132)',   # red
+    'rgb(75, 192, 192)',   # green
+    'rgb(255, 159, 64)',   # orange
+    'rgb(153, 102, 255)',  # purple
+    'rgb(255, 205, 86)',   # yellow
+    'rgb(201, 203, 207)',  # grey
+    'rgb(255, 99, 71)',    # tomato
+    'rgb(0, 128, 128)',    # teal
+    'rgb(106, 90, 205)'    # slate blue
+)
+_N_COLORS = len(_COLORS)
+
+# Display color for each point status
+_STATUS_COLORS = MappingProxyType({
+    "normal": "green",
+    "warning": "orange",
+    "alarm": "red",
+    "error": "purple",
+    "unknown": "gray"
+})
+
+# Height of a card placeholder, in pixels, before the card itself is rendered
+CARD_PLACEHOLDER_HEIGHT = 180
+
+# Reports card placeholders near the viewport back to the server, which renders them as full cards
+CARD_OBSERVER_JS = """
+<script>
+const cardObserver = new IntersectionObserver((entries) => {
+    const visible = entries.filter((entry) => entry.isIntersecting).map((entry) => entry.target);
+    visible.forEach((element) => cardObserver.unobserve(element));
+    if (visible.length) {
+        emitEvent('cards_visible', visible.map((element) => element.dataset.pid));
+    }
+}, {rootMargin: '200px'});
+
+new MutationObserver(() => {
+    document.querySelectorAll('[data-pid]:not([data-observed])').forEach((element) => {
+        element.dataset.observed = '1';
+        cardObserver.observe(element);
+    });
+}).observe(document.body, {childList: true, subtree: true});
+</script>
+"""
+
+# Relative timestamps are recomputed at most once per bucket of this many seconds
+TIMESTAMP_BUCKET_SECONDS = 30
+
+# Canvas the trend chart is drawn on; it stays in place while the chart's datasets are replaced
+TREND_CHART_HTML = '<canvas id="trendChart" style="width: 100%; height: 100%;"></canvas>'
+
+# Browser-side trend chart updates. The Chart.js chart is created once per canvas and kept on
+# window.trendChart; each refresh only swaps in the new datasets. A canvas that was just added may
+# not be mounted yet, so a missing canvas is retried for a few frames.
+TREND_CHART_JS = """
+<script>
+window.updateTrendChart = (datasets, retries = 10) => {
+    const canvas = document.getElementById('trendChart');
+    if (!canvas) {
+        if (retries > 0) requestAnimationFrame(() => window.updateTrendChart(datasets, retries - 1));
+        return;
+    }
+    if (!window.trendChart || window.trendChart.canvas !== canvas) {
+        if (window.trendChart) window.trendChart.destroy();
+        window.trendChart = new Chart(canvas.getContext('2d'), {
+            type: 'line',
+            data: {datasets: []},
+            options: {
+                responsive: true,
+                maintainAspectRatio: false,
+                scales: {
+                    x: {
+                        type: 'time',
+                        time: {
+                            unit: 'minute',
+                            displayFormats: {
+                                minute: 'HH:mm',
+                                hour: 'HH:mm',
+                                day: 'MMM D'
+                            }
+                        },
+                        title: {
+                            display: true,
+                            text: 'Time'
+                        }
+                    },
+                    y: {
+                        title: {
+                            display: true,
+                            text: 'Value'
+                        }
+                    }
+                },
+                plugins: {
+                    legend: {
+                        position: 'top'
+                    },
+                    tooltip: {
+                        mode: 'index',
+                        intersect: false
+                    }
+                }
+            }
+        });
+    }
+    window.trendChart.data.datasets = datasets;
+    window.trendChart.update('none');
+};
+</script>
+"""
+
 # Singleton for storing page components that need to be accessed across functions
 class UIState:
     def __init__(self):
         self.control_cards = None
         self.trend_chart = None
         self.connected_websocket = None
+        self.websocket_task = None
         self.points_by_id = {}
+        self.card_elements = {}
         self.selected_points_for_trend = set()
         self.trend_data = {}
-        self.on_refresh_callback = None
+        self.on_refresh_callbacks = set()
                 
         # Add these to store important container references
         self.selected_points_list = None
@@ -35,35 +185,189 @@ class UIState:
         self.table_container = None
 
         #debounce
-        self.last_refresh_time = 0
-        self.refresh_cooldown = 10
+        self.last_refresh_time = float('-inf')
+        self.refresh_cooldown = 0.5
+        self.refresh_lock = asyncio.Lock()
+        
+        # Trends page refresh, and the pending debounced call to it
+        self.refresh_trends = None
+        self.pending_trend_task = None
+        
+        # Trends page update of the selected points list
+        self.update_selected_points_list = None
+        
+        # Pushed point changes not yet rendered, and the pending debounced render of them
+        self.pending_changed = {}
+        self.pending_removed = set()
+        self.pending_delta_task = None
 
 # Create singleton instance
 ui_state = UIState()
 
+# asyncio.Task takes eager_start from Python 3.12
+_EAGER_START = sys.version_info >= (3, 12)
+
+def start_task(coro) -> asyncio.Task:
+    """
+    Start one of this app's background tasks, eagerly where supported, so a coroutine that finishes
+    without awaiting skips the scheduler. Only these tasks start eagerly, not the server's own.
+    """
+    if _EAGER_START:
+        return asyncio.Task(coro, loop=asyncio.get_running_loop(), eager_start=True)
+    return asyncio.create_task(coro)
+
+# Shared HTTP client for API calls, so requests reuse pooled keep-alive connections
+_client: Optional[httpx.AsyncClient] = None
+
+async def get_client() -> httpx.AsyncClient:
+    """Get the shared API client, creating it on first use"""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            base_url=API_BASE_URL,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+    return _client
+
+# Cached GET responses by (path, params), as (expiry, fetch task)
+_get_cache: Dict[tuple, tuple] = {}
+
+async def cached_get(path: str, params: Optional[Dict[str, Any]] = None, ttl: float = GET_CACHE_TTL) -> httpx.Response:
+    """GET path from the API, reusing a response fetched or still being fetched within the last ttl seconds"""
+    key = (path, tuple(sorted(params.items())) if params else ())
+    now = time.monotonic()
+    entry = _get_cache.get(key)
+    if entry is None or entry[0] <= now:
+        client = await get_client()
+        entry = (now + ttl, asyncio.ensure_future(client.get(path, params=params)))
+        _get_cache[key] = entry
+    
+    try:
+        # Shield the shared fetch, so one cancelled caller doesn't cancel it for the others
+        return await asyncio.shield(entry[1])
+    except Exception:
+        # Don't keep failures around for other callers
+        if _get_cache.get(key) is entry:
+            del _get_cache[key]
+        raise
+
+async def _call(method: str, path: str, context: str, **kwargs) -> Optional[httpx.Response]:
+    """
+    Send a request to the API, returning the response, or None after notifying the user it failed.
+    context describes the action for the error message, e.g. "saving settings".
+    """
+    try:
+        client = await get_client()
+        response = await client.request(method, path, **kwargs)
+        response.raise_for_status()
+        return response
+    except httpx.HTTPStatusError as e:
+        ui.notify(f"Error {context}: {e.response.text}", type="negative")
+    except httpx.HTTPError as e:
+        # Transport errors like a refused connection or a timeout
+        ui.notify(f"Error {context}: {str(e)}", type="negative")
+    finally:
+        # A write may have changed what the cached reads returned
+        if method != 'GET':
+            invalidate_get_cache()
+    return None
+
+def invalidate_get_cache():
+    """Forget the cached GET responses, so reads after a change see fresh data"""
+    _get_cache.clear()
+
+def response_json(response: httpx.Response) -> Any:
+    """Decode an API response body with orjson"""
+    return orjson.loads(response.content)
+
+async def close_client():
+    """Close the shared API client"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+app.on_shutdown(close_client)
+
 # Helper functions
-def format_timestamp(timestamp):
-    """Format timestamp for display"""
-    if not timestamp:
-        return "Never"
+def parse_timestamp(timestamp):
+    """Parse an ISO timestamp string into a naive datetime; returns None if it can't be parsed"""
+    if isinstance(timestamp, datetime):
+        return timestamp.replace(tzinfo=None)
+    if not isinstance(timestamp, str):
+        return None
     
-    if isinstance(timestamp, str):
+    if parse_datetime_as_naive is not None:
         try:
-            # Parse the ISO format string into a datetime object
-            timestamp = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-            # Remove timezone info to make it naive
-            timestamp = timestamp.replace(tzinfo=None)
+            return parse_datetime_as_naive(timestamp)
         except ValueError:
-            return timestamp
+            return None
     
-    # Make sure both datetimes are naive or both are aware
-    now = datetime.now()
+    try:
+        # Parse the ISO format string into a datetime object
+        if timestamp.endswith('Z'):
+            timestamp = timestamp[:-1] + '+00:00'
+        # Remove timezone info to make it naive
+        return datetime.fromisoformat(timestamp).replace(tzinfo=None)
+    except ValueError:
+        return None
+
+# Naive UTC epoch and one millisecond, for converting datetimes to epoch milliseconds
+_EPOCH = datetime(1970, 1, 1)
+_ONE_MS = timedelta(milliseconds=1)
+
+def _local_utc_offset_ms(wall_ms: int) -> int:
+    """UTC offset, in milliseconds, of this machine's local time at a wall-clock time in epoch-style milliseconds"""
+    wall = _EPOCH + timedelta(milliseconds=wall_ms)
+    return wall.astimezone().utcoffset() // _ONE_MS
+
+def epoch_ms(timestamps: List[str]) -> np.ndarray:
+    """
+    Convert ISO timestamps to epoch milliseconds, as an int64 array.
+    Timestamps with a Z or UTC offset are exact instants; naive ones are in the server's local time.
+    """
+    ms = np.empty(len(timestamps), dtype=np.int64)
+    naive = np.zeros(len(timestamps), dtype=bool)
+    for i, timestamp in enumerate(timestamps):
+        if timestamp.endswith('Z'):
+            timestamp = timestamp[:-1] + '+00:00'
+        parsed = datetime.fromisoformat(timestamp)
+        if parsed.tzinfo is None:
+            naive[i] = True
+        else:
+            parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+        ms[i] = (parsed - _EPOCH) // _ONE_MS
     
-    # If timestamp has timezone but now doesn't, remove timezone
-    if hasattr(timestamp, 'tzinfo') and timestamp.tzinfo is not None:
-        timestamp = timestamp.replace(tzinfo=None)
+    # Naive timestamps are wall-clock times, so take off the local UTC offset. It only changes
+    # on the hour, so it's looked up once per distinct hour, not per sample
+    if naive.any():
+        wall_ms = ms[naive]
+        hours, hour_idx = np.unique(wall_ms // 3_600_000, return_inverse=True)
+        offsets = np.array([_local_utc_offset_ms(hour * 3_600_000) for hour in hours.tolist()], dtype=np.int64)
+        ms[naive] = wall_ms - offsets[hour_idx]
+    return ms
+
+def format_timestamp(timestamp, now: Optional[datetime] = None):
+    """Format timestamp for display, relative to now (the current time if not given)"""
+    if not timestamp:
+        return "Never"
+    
+    # Identical timestamps rendered within the same bucket reuse the cached text
+    now = now or datetime.now()
+    return _format_timestamp_cached(timestamp, int(now.timestamp() // TIMESTAMP_BUCKET_SECONDS))
+
+@lru_cache(maxsize=4096)
+def _format_timestamp_cached(timestamp, bucket: int) -> str:
+    """Format an ISO timestamp string or datetime relative to the start of the given time bucket"""
+    if not isinstance(timestamp, datetime):
+        parsed = parse_timestamp(timestamp)
+        if parsed is None:
+            return timestamp
+        timestamp = parsed
+    timestamp = timestamp.replace(tzinfo=None)
     
-    delta = now - timestamp
+    # The result depends only on the cache key, so it stays valid for the whole bucket
+    delta = datetime.fromtimestamp(bucket * TIMESTAMP_BUCKET_SECONDS) - timestamp
     
     if delta < timedelta(minutes=1):
         return "Just now"
@@ -78,14 +382,7 @@ def format_timestamp(timestamp):
 
 def get_status_color(status: str) -> str:
     """Get color for status display"""
-    colors = {
-        "normal": "green",
-        "warning": "orange",
-        "alarm": "red",
-        "error": "purple",
-        "unknown": "gray"
-    }
-    return colors.get(status, "gray")
+    return _STATUS_COLORS.get(status, "gray")
 
 # Main dashboard page
 def create_dashboard():
@@ -99,25 +396,58 @@ def create_dashboard():
     
     # Create container for control cards
     ui_state.control_cards = ui.column().classes('w-full grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 xl:grid-cols-4 gap-4')
+    
+    # Cards are rendered lazily as their placeholders scroll into view
+    ui.add_body_html(CARD_OBSERVER_JS)
+    ui.on('cards_visible', render_visible_cards)
 
 async def refresh_dashboard():
     """Refresh the dashboard with current data"""
+    # A refresh that's already running covers this one
+    if ui_state.refresh_lock.locked():
+        return
+    
     # Check refresh cooldown
-    current_time = time.time()
+    current_time = time.monotonic()
     if current_time - ui_state.last_refresh_time < ui_state.refresh_cooldown:
         return
     
-    ui_state.last_refresh_time = current_time
-    
+    async with ui_state.refresh_lock:
+        ui_state.last_refresh_time = current_time
+        await _refresh_dashboard()
+
+async def poll_dashboard():
+    """Periodic dashboard refresh, skipped while the WebSocket is connected and pushing changes"""
+    if ui_state.connected_websocket:
+        return
+    await refresh_dashboard()
+
+def show_invalid_response():
+    """Replace the dashboard cards with an error message and a retry button"""
+    if ui_state.control_cards:
+        ui_state.control_cards.clear()
+        with ui_state.control_cards:
+            ui.label('API returned invalid or empty response').classes('text-negative')
+            ui.button('Retry', on_click=refresh_dashboard).props('color=primary')
+
+async def _refresh_dashboard():
+    """Fetch the current points and update the dashboard"""
     try:
         # Fetch points from API
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f'{API_BASE_URL}/control-points')
+        response = await cached_get('/control-points')
         
-        # Only process if we got a valid JSON response
-        if response.text and ('application/json' in response.headers.get('content-type', '')):
-            points = response.json()
-            
+        # Only process if we got a valid JSON response; the body is decoded once, by the parser
+        points = None
+        if 'application/json' in response.headers.get('content-type', ''):
+            try:
+                points = response_json(response)
+            except orjson.JSONDecodeError:
+                pass
+        
+        if points is None:
+            print("Response is not JSON or is empty")
+            show_invalid_response()
+        else:
             # Add type checking and error handling
             if not isinstance(points, list):
                 if isinstance(points, dict) and 'data' in points:
@@ -128,74 +458,20 @@ async def refresh_dashboard():
             
             # Create dictionary of new points by ID
             new_points_by_id = {point['id']: point for point in points}
-            
-            # Create a dictionary to keep track of card elements by point ID
-            if not hasattr(ui_state, 'card_elements'):
-                ui_state.card_elements = {}
-            
-            # Handle case where there are no points
-            if not points and ui_state.control_cards:
-                ui_state.control_cards.clear()
-                with ui_state.control_cards:
-                    ui.label('No control points available. Add some in the Configuration tab.')
-                    ui.button('Add Sample Data', on_click=add_sample_data).props('color=primary')
-                ui_state.card_elements = {}
-                ui_state.points_by_id = {}
-                return
-            
-            # Find points to remove (in current state but not in new data)
-            points_to_remove = set(ui_state.points_by_id.keys()) - set(new_points_by_id.keys())
-            for point_id in points_to_remove:
-                if point_id in ui_state.card_elements:
-                    ui_state.card_elements[point_id].delete()
-                    del ui_state.card_elements[point_id]
-            
-            # Update or add points
-            for point_id, point in new_points_by_id.items():
-                old_point = ui_state.points_by_id.get(point_id)
-                
-                # Check if point is new or has changed
-                is_new = point_id not in ui_state.points_by_id
-                has_changed = not is_new and (
-                    point.get('value') != old_point.get('value') or
-                    point.get('status') != old_point.get('status') or
-                    point.get('timestamp') != old_point.get('timestamp')
-                )
-                
-                if is_new:
-                    # Create new card for this point
-                    if ui_state.control_cards:
-                        with ui_state.control_cards:
-                            ui_state.card_elements[point_id] = create_control_card(point)
-                
-                elif has_changed:
-                    # Update existing card
-                    if point_id in ui_state.card_elements:
-                        # Remove old card
-                        ui_state.card_elements[point_id].delete()
-                        
-                        # Create updated card
-                        with ui_state.control_cards:
-                            ui_state.card_elements[point_id] = create_control_card(point)
-            
-            # Update points_by_id with the latest data
-            ui_state.points_by_id = new_points_by_id
-            
-        else:
-            print("Response is not JSON or is empty")
-            if ui_state.control_cards:
-                ui_state.control_cards.clear()
-                with ui_state.control_cards:
-                    ui.label('API returned invalid or empty response').classes('text-negative')
-                    ui.button('Retry', on_click=refresh_dashboard).props('color=primary')
+            render_points(new_points_by_id)
         
-        # Call the refresh callback if needed
-        if ui_state.on_refresh_callback:
-            await ui_state.on_refresh_callback()
+        # Call the refresh callbacks registered by the open pages; one failing doesn't stop the others
+        if ui_state.on_refresh_callbacks:
+            results = await asyncio.gather(*(callback() for callback in ui_state.on_refresh_callbacks), return_exceptions=True)
+            errors = [result for result in results if isinstance(result, Exception)]
+            for error in errors:
+                print(f"Refresh callback error: {str(error)}")
+                traceback.print_exception(error)
+            if errors:
+                ui.notify(f'Error refreshing page: {str(errors[0])}', type='negative')
             
     except Exception as e:
         print(f"Detailed error: {str(e)}")
-        import traceback
         traceback.print_exc()
         ui.notify(f'Error refreshing dashboard: {str(e)}', type='negative')
         
@@ -206,16 +482,160 @@ async def refresh_dashboard():
                 ui.label('Error loading control points. API may not be available.').classes('text-negative')
                 ui.button('Retry', on_click=refresh_dashboard).props('color=primary')
 
-def create_control_card(point: Dict[str, Any]):
+def render_points(new_points_by_id: Dict[str, Dict[str, Any]]):
+    """Bring the dashboard cards in line with new_points_by_id, touching only what changed"""
+    # Parse each timestamp once, reusing the previous parse when it hasn't changed
+    for point_id, point in new_points_by_id.items():
+        old_point = ui_state.points_by_id.get(point_id)
+        if old_point and old_point.get('timestamp') == point.get('timestamp'):
+            point['_ts_dt'] = old_point.get('_ts_dt')
+        else:
+            point['_ts_dt'] = parse_timestamp(point.get('timestamp'))
+    
+    # Handle case where there are no points
+    if not new_points_by_id and ui_state.control_cards:
+        ui_state.control_cards.clear()
+        with ui_state.control_cards:
+            ui.label('No control points available. Add some in the Configuration tab.')
+            ui.button('Add Sample Data', on_click=add_sample_data).props('color=primary')
+        ui_state.card_elements = {}
+        ui_state.points_by_id = {}
+        return
+    
+    # Find points to remove (in current state but not in new data)
+    points_to_remove = set(ui_state.points_by_id.keys()) - set(new_points_by_id.keys())
+    for point_id in points_to_remove:
+        if point_id in ui_state.card_elements:
+            ui_state.card_elements[point_id]['card'].delete()
+            del ui_state.card_elements[point_id]
+    
+    # Update or add points, formatting every card's timestamp against the same time
+    now = datetime.now()
+    for point_id, point in new_points_by_id.items():
+        old_point = ui_state.points_by_id.get(point_id)
+        
+        # Check if point is new or has changed
+        is_new = point_id not in ui_state.points_by_id
+        has_changed = not is_new and (
+            point.get('value') != old_point.get('value') or
+            point.get('status') != old_point.get('status') or
+            point.get('timestamp') != old_point.get('timestamp')
+        )
+        
+        if is_new:
+            # Add a placeholder for this point; the card is rendered once it scrolls into view
+            if ui_state.control_cards:
+                with ui_state.control_cards:
+                    ui_state.card_elements[point_id] = create_card_placeholder(point_id)
+        
+        elif has_changed:
+            # Update existing card
+            if point_id in ui_state.card_elements:
+                refs = ui_state.card_elements[point_id]
+                
+                if refs.get('pending'):
+                    # Not rendered yet; it will be built from the latest data when it becomes visible
+                    pass
+                elif any(point.get(field) != old_point.get(field) for field in CARD_LAYOUT_FIELDS):
+                    # The card's layout depends on these fields, so rebuild it
+                    ui_state.card_elements[point_id] = render_control_card(refs['card'], point, now)
+                else:
+                    # Only the live values changed; patch the existing elements in place
+                    update_control_card(refs, point, now)
+    
+    # Update points_by_id with the latest data
+    ui_state.points_by_id = new_points_by_id
+
+def apply_points_delta(changed: List[Dict[str, Any]], removed: List[str]):
+    """Apply points pushed by the server over the WebSocket without refetching the full list"""
+    new_points_by_id = {**ui_state.points_by_id, **{point['id']: point for point in changed}}
+    for point_id in removed:
+        new_points_by_id.pop(point_id, None)
+    render_points(new_points_by_id)
+
+def queue_points_delta(changed: List[Dict[str, Any]], removed: List[str]):
+    """Queue pushed point changes, coalescing a burst of messages into one trailing render"""
+    # A cached point list from before the push would undo it on the next refresh
+    invalidate_get_cache()
+    
+    for point in changed:
+        ui_state.pending_changed[point['id']] = point
+        ui_state.pending_removed.discard(point['id'])
+    for point_id in removed:
+        ui_state.pending_changed.pop(point_id, None)
+        ui_state.pending_removed.add(point_id)
+    
+    if ui_state.pending_delta_task and not ui_state.pending_delta_task.done():
+        return
+    ui_state.pending_delta_task = start_task(_apply_points_delta_after(POINTS_DELTA_DEBOUNCE))
+
+async def _apply_points_delta_after(delay):
+    """Wait out the debounce delay, then render every queued point change at once"""
+    try:
+        await asyncio.sleep(delay)
+        changed, removed = ui_state.pending_changed, ui_state.pending_removed
+        ui_state.pending_changed, ui_state.pending_removed = {}, set()
+        
+        # Pushes arrive in the WebSocket's task, which has no slot, so render on the dashboard's page
+        page = ui_state.control_cards.client if ui_state.control_cards else contextlib.nullcontext()
+        with page:
+            apply_points_delta(list(changed.values()), list(removed))
+    finally:
+        ui_state.pending_delta_task = None
+
+def create_card_placeholder(point_id):
+    """Create a fixed-height placeholder for a point's card, to be rendered when it nears the viewport"""
+    placeholder = ui.element('div').classes('w-full').style(f'min-height: {CARD_PLACEHOLDER_HEIGHT}px')
+    placeholder.props(f'data-pid="{point_id}"')
+    return {'card': placeholder, 'pending': True}
+
+def render_control_card(container, point: Dict[str, Any], now: Optional[datetime] = None) -> Dict[str, Any]:
+    """Render a point's full card inside its placeholder, returning the card refs"""
+    container.clear()
+    container.style(remove=f'min-height: {CARD_PLACEHOLDER_HEIGHT}px')
+    with container:
+        refs = create_control_card(point, now)
+    
+    # Deleting the card removes its placeholder with it
+    refs['card'] = container
+    return refs
+
+def render_visible_cards(event):
+    """Render the cards whose placeholders the browser reports as near the viewport"""
+    now = datetime.now()
+    for point_id in event.args:
+        refs = ui_state.card_elements.get(point_id)
+        point = ui_state.points_by_id.get(point_id)
+        if refs and refs.get('pending') and point:
+            ui_state.card_elements[point_id] = render_control_card(refs['card'], point, now)
+
+def percentage_fn(min_value, max_value):
+    """Build a function mapping a value to its whole percent within [min_value, max_value], clamped to 0-100"""
+    if max_value <= min_value:
+        return lambda value: 50
+    scale = 100 / (max_value - min_value)
+    return lambda value: int(round(max(0, min(100, (value - min_value) * scale))))
+
+def register_refresh_callback(callback):
+    """Await callback after every dashboard refresh, until the current client disconnects"""
+    ui_state.on_refresh_callbacks.add(callback)
+    ui.context.client.on_disconnect(lambda: ui_state.on_refresh_callbacks.discard(callback))
+
+def create_control_card(point: Dict[str, Any], now: Optional[datetime] = None) -> Dict[str, Any]:
+    """Create a card for a control point, returning references to the elements that show live values"""
     point_id = point['id']
     point_type = point.get('type', 'scale')
     status = point.get('status')
+    refs = {'value_label': None, 'value_input': None, 'progress': None}
     
     card = ui.card().classes('w-full')
+    refs['card'] = card
     with card:
         with ui.row().classes('w-full items-center justify-between'):
             ui.label(point['name']).classes('text-h6')
-            ui.icon('fiber_manual_record', color=get_status_color(status)).tooltip(f'Status: {status.capitalize()}')
+            with ui.icon('fiber_manual_record', color=get_status_color(status)) as status_icon:
+                refs['status_tooltip'] = ui.tooltip(f'Status: {status.capitalize()}')
+            refs['status_icon'] = status_icon
         
         ui.separator()
             
@@ -226,10 +646,11 @@ def create_control_card(point: Dict[str, Any]):
             value_text = f"{point.get('value', 'N/A')} {point.get('unit', '')}"
             
             if point_type == 'SCALE':
-                ui.label(f"Value: {value_text}").classes('text-bold')
+                refs['value_label'] = ui.label(f"Value: {value_text}").classes('text-bold')
             else:  # actuator
                 with ui.row().classes('items-center'):
                     value_input = ui.number(label='Value', value=point.get('value', 0))
+                    refs['value_input'] = value_input
                     
                     if point.get('min_value') is not None:
                         value_input.props(f"min={point['min_value']}")
@@ -245,33 +666,56 @@ def create_control_card(point: Dict[str, Any]):
             min_value = point.get('min_value', 0)
             max_value = point.get('max_value', 100)
             
-            # Calculate percentage for progress bar
-            if max_value > min_value:
-                percentage = (current_value - min_value) / (max_value - min_value) * 100
-                percentage = max(0, min(100, percentage))
-            else:
-                percentage = 50
+            # Calculate percentage for progress bar, in whole percent. The range is a layout field,
+            # so it's fixed for the card's lifetime and updates reuse the same mapping
+            refs['pct_fn'] = percentage_fn(min_value, max_value)
+            refs['_last_pct'] = refs['pct_fn'](current_value)
             
-            ui.linear_progress(value=percentage/100).classes('w-full')
+            refs['progress'] = ui.linear_progress(value=refs['_last_pct']/100).classes('w-full')
             ui.label(f"Range: {min_value} - {max_value} {point.get('unit', '')}").classes('text-caption')
         
         ui.separator()
         
         with ui.row().classes('w-full items-center justify-between'):
-            ui.label(f"Updated: {format_timestamp(point.get('timestamp'))}").classes('text-caption')
+            refs['_last_ts_text'] = format_timestamp(point.get('_ts_dt') or point.get('timestamp'), now)
+            refs['ts_label'] = ui.label(f"Updated: {refs['_last_ts_text']}").classes('text-caption')
             
             with ui.row().classes('gap-2'):
                 # Trend button to add/remove from trend view
-                trend_button = ui.button(icon='show_chart', on_click=lambda pid=point_id: toggle_trend_point(pid))
-                
-                if point_id in ui_state.selected_points_for_trend:
-                    trend_button.props('color=primary')
+                refs['trend_button'] = ui.button(icon='show_chart', on_click=lambda pid=point_id: toggle_trend_point(pid))
+                paint_trend_button(refs['trend_button'], point_id)
                 
                 # Edit button
                 ui.button(icon='edit', on_click=lambda pid=point_id: edit_control_point(pid)).props('flat')
                 
                 # Delete button
                 ui.button(icon='delete', on_click=lambda pid=point_id: delete_control_point(pid)).props('flat color=negative')
+    
+    return refs
+
+def update_control_card(refs: Dict[str, Any], point: Dict[str, Any], now: Optional[datetime] = None):
+    """Update the live value, status and timestamp of an existing card in place"""
+    status = point.get('status')
+    refs['status_icon'].props(f'color={get_status_color(status)}')
+    refs['status_tooltip'].set_text(f'Status: {status.capitalize()}')
+    
+    if refs['value_label'] is not None:
+        refs['value_label'].set_text(f"Value: {point.get('value', 'N/A')} {point.get('unit', '')}")
+    if refs['value_input'] is not None:
+        refs['value_input'].set_value(point.get('value', 0))
+    
+    if refs['progress'] is not None:
+        # Only send the progress bar an update when the whole percent changes
+        pct = refs['pct_fn'](point.get('value', 0))
+        if pct != refs['_last_pct']:
+            refs['progress'].set_value(pct/100)
+            refs['_last_pct'] = pct
+    
+    # A new timestamp often renders the same text, e.g. "Just now"; only send the label a change
+    ts_text = format_timestamp(point.get('_ts_dt') or point.get('timestamp'), now)
+    if ts_text != refs['_last_ts_text']:
+        refs['ts_label'].set_text(f"Updated: {ts_text}")
+        refs['_last_ts_text'] = ts_text
 
 # Configuration page
 def create_config_page():
@@ -341,35 +785,83 @@ def create_control_points_config():
         {'name': 'actions', 'label': 'Actions', 'field': 'actions'}
     ]
     
+    # Function to fetch one page of table rows
+    async def fetch_points_page(pagination):
+        rows_per_page = pagination['rowsPerPage']
+        params = {
+            'offset': (pagination['page'] - 1) * rows_per_page,
+            'limit': rows_per_page
+        }
+        
+        # With server-side pagination the table leaves sorting to the server too
+        if pagination.get('sortBy'):
+            params['sort_by'] = pagination['sortBy']
+            params['descending'] = bool(pagination.get('descending'))
+        
+        response = await cached_get('/control-points', params=params)
+        return response_json(response), int(response.headers.get('x-total-count', 0))
+    
+    # Function to load the page the table asks for
+    async def load_table_page(table, pagination):
+        rows, total = await fetch_points_page(pagination)
+        
+        # A page emptied by deletions falls back to the last page that still has rows
+        last_page = max(1, -(-total // pagination['rowsPerPage']))
+        if pagination['page'] > last_page:
+            pagination = {**pagination, 'page': last_page}
+            rows, total = await fetch_points_page(pagination)
+        
+        table.rows = rows
+        table.pagination = {**pagination, 'rowsNumber': total}
+    
+    # The table, once it's been created
+    table = None
+    
     # Function to update the table data
     async def update_table_data():
+        nonlocal table
         try:
+            # Keep the table, and the page the user is on, and only reload that page's rows
+            if table is not None:
+                await load_table_page(table, table.pagination)
+                return
+            
             table_container.clear()
-
-            async with httpx.AsyncClient() as client:
-                response = await client.get(f'{API_BASE_URL}/control-points')
-            points = response.json()
             
-            # Create the table fresh each time
+            pagination = {'page': 1, 'rowsPerPage': TABLE_ROWS_PER_PAGE}
+            points, total = await fetch_points_page(pagination)
+            
             with table_container:
-                # Use the more modern ui.table approach
-                with ui.table(columns=columns, rows=points, row_key='id').classes('w-full'):
-                    # Add a template for the actions column
-                    with ui.table_column('actions'):
-                        def render_actions(item):
-                            with ui.row().classes('gap-2'):
-                                ui.button(icon='edit', on_click=lambda: edit_control_point(item['id'])).props('flat size=sm')
-                                ui.button(icon='delete', on_click=lambda: delete_control_point(item['id'])).props('flat color=negative size=sm')
-                        
-                        # Register the template
-                        ui.table_cell(render_actions)
-                        
+                # Only the current page is sent; other pages and sort orders are requested from the server
+                new_table = ui.table(
+                    columns=columns,
+                    rows=points,
+                    row_key='id',
+                    pagination={**pagination, 'rowsNumber': total}
+                ).classes('w-full')
+                new_table.on('request', lambda e: load_table_page(new_table, e.args['pagination']))
+                
+                # Add a template for the actions column; its buttons emit the row's ID back to the server
+                new_table.add_slot('body-cell-actions', r'''
+                    <q-td :props="props">
+                        <q-btn flat size="sm" icon="edit" @click="() => $parent.$emit('edit', props.row.id)" />
+                        <q-btn flat size="sm" color="negative" icon="delete" @click="() => $parent.$emit('delete', props.row.id)" />
+                    </q-td>
+                ''')
+                new_table.on('edit', lambda e: edit_control_point(e.args))
+                new_table.on('delete', lambda e: delete_control_point(e.args))
+            
+            table = new_table
+        
         except Exception as e:
+            # Start over with a new table on the next refresh
+            table = None
+            table_container.clear()
             with table_container:
                 ui.label(f"Error loading control points: {str(e)}").classes('text-negative')
     
-    # Set the refresh callback
-    ui_state.on_refresh_callback = update_table_data
+    # Register the refresh callback
+    register_refresh_callback(update_table_data)
     
     # Initial data load
     ui.timer(0.1, update_table_data, once=True)
@@ -392,17 +884,31 @@ def create_groups_config():
             multiple=True
         ).props('use-chips')
         
+        # Key of the points the options were last built from
+        options_key = None
+        
         # Update options when points are loaded
         async def update_point_options():
-            async with httpx.AsyncClient() as client:
-                response = await client.get(f'{API_BASE_URL}/control-points')
-            points = response.json()
+            nonlocal options_key
+            
+            # The dashboard keeps the points current; only fetch them if it hasn't loaded yet
+            points = list(ui_state.points_by_id.values())
+            if not points:
+                response = await cached_get('/control-points')
+                points = response_json(response)
+            
+            # Skip rebuilding the options unless a point was added, removed or renamed
+            key = hash(tuple(sorted((p['id'], p['name']) for p in points)))
+            if key == options_key:
+                return
+            options_key = key
+            
             options = [{'label': f"{p['name']} ({p['id']})", 'value': p['id']} for p in points]
-            points_select.options = options
+            points_select.set_options(options)
         
-        # Set refresh callback
-        ui_state.on_refresh_callback = update_point_options
-        update_point_options()
+        # Register refresh callback
+        register_refresh_callback(update_point_options)
+        ui.timer(0.1, update_point_options, once=True)
         
         with ui.row().classes('w-full justify-end'):
             ui.button('Clear', on_click=lambda: [
@@ -427,9 +933,8 @@ def create_settings_config():
         settings_form = ui.element('div').classes('w-full')
         
         async def load_settings():
-            async with httpx.AsyncClient() as client:
-                response = await client.get(f'{API_BASE_URL}/settings')
-            settings = response.json()
+            response = await cached_get('/settings')
+            settings = response_json(response)
             
             settings_form.clear()
             
@@ -456,11 +961,8 @@ def create_trends_page():
 
     # Function to refresh the trend chart
     async def refresh_trends():
-        chart_container.clear()
-        
         if not ui_state.selected_points_for_trend:
-            with chart_container:
-                ui.label('No points selected for trending').classes('text-center py-8')
+            show_trend_message('No points selected for trending')
             return
         
         # Determine time range
@@ -488,39 +990,47 @@ def create_trends_page():
         ui_state.trend_data = {}
         
         try:
-            for point_id in ui_state.selected_points_for_trend:
-                async with httpx.AsyncClient() as client:
-                    response = await client.get(f'{API_BASE_URL}/historical-data/{point_id}',
-                    params={
-                        'start_time': start_time.isoformat() if start_time else None,
-                        'end_time': end_time.isoformat()
-                    }
-                )
+            client = await get_client()
+            params = {
+                'start_time': start_time.isoformat() if start_time else None,
+                'end_time': end_time.isoformat()
+            }
+            
+            # Fetch every selected point concurrently over the shared connection pool
+            point_ids = list(ui_state.selected_points_for_trend)
+            responses = await asyncio.gather(
+                *(client.get(f'/historical-data/{point_id}', params=params) for point_id in point_ids),
+                return_exceptions=True
+            )
+            
+            for point_id, response in zip(point_ids, responses):
+                if isinstance(response, Exception):
+                    ui.notify(f'Error fetching trend data for {point_id}: {str(response)}', type='negative')
+                    continue
                 
-                data = response.json()
+                data = response_json(response)
                 if data.get('timestamps') and data.get('values'):
+                    # Keep the samples as columns, with numeric timestamps Chart.js doesn't have to parse
                     ui_state.trend_data[point_id] = {
                         'label': ui_state.points_by_id.get(point_id, {}).get('name', point_id),
-                        'timestamps': data['timestamps'],
-                        'values': data['values'],
+                        'timestamps': epoch_ms(data['timestamps']),
+                        'values': np.asarray(data['values'], dtype=np.float64),
                         'unit': ui_state.points_by_id.get(point_id, {}).get('unit', '')
                     }
             
-            with chart_container:
-                if not ui_state.trend_data:
-                    ui.label('No historical data available for the selected time range').classes('text-center py-8')
-                else:
-                    create_trend_chart()
+            if not ui_state.trend_data:
+                show_trend_message('No historical data available for the selected time range')
+            else:
+                create_trend_chart()
                     
         except Exception as e:
             ui.notify(f'Error fetching trend data: {str(e)}', type='negative')
-            with chart_container:
-                ui.label(f'Error loading trend data: {str(e)}').classes('text-negative text-center py-8')
+            show_trend_message(f'Error loading trend data: {str(e)}', 'text-negative text-center py-8')
 
     """Create the trends page"""
     with ui.row().classes('w-full justify-between items-center'):
         ui.label('Historical Trends').classes('text-h5')
-        ui.button('Refresh', on_click=refresh_trends).props('icon=refresh')
+        ui.button('Refresh', on_click=schedule_trend_refresh).props('icon=refresh')
     
     with ui.card().classes('w-full'):
         ui.label('Selected Control Points')
@@ -565,10 +1075,12 @@ def create_trends_page():
             
             time_range.on('update:model-value', toggle_custom_range)
             
-            ui.button('Update Chart', on_click=refresh_trends).props('color=primary')
+            ui.button('Update Chart', on_click=schedule_trend_refresh).props('color=primary')
     
-    # Chart container
-    chart_container = ui.card().classes('w-full h-96')    
+    # Chart container, and the browser-side chart it's drawn with
+    ui_state.chart_container = ui.card().classes('w-full h-96')
+    ui_state.trend_chart = None
+    ui.add_body_html(TREND_CHART_JS)
     
     # Function to update the selected points list
     async def update_selected_points_list():
@@ -587,15 +1099,42 @@ def create_trends_page():
     # Function to remove a point from trend view
     async def remove_from_trend(point_id):
         if point_id in ui_state.selected_points_for_trend:
-            ui_state.selected_points_for_trend.remove(point_id)
-            await update_selected_points_list()
-            await refresh_trends()
+            await toggle_trend_point(point_id)
+    
+    # Register the refreshes so changes made on other pages reach this page
+    ui_state.refresh_trends = refresh_trends
+    ui_state.update_selected_points_list = update_selected_points_list
     
     # Initialize
     update_selected_points_list()
     refresh_trends()
 
 # Helper functions for the UI interactions
+def schedule_trend_refresh():
+    """Refresh the trend chart shortly, coalescing a burst of requests into one trailing refresh"""
+    if ui_state.pending_trend_task and not ui_state.pending_trend_task.done():
+        return
+    # The task starts with an empty slot stack, so it's handed the page that asked for the refresh
+    client = ui.context.client
+    ui_state.pending_trend_task = start_task(_refresh_trends_after(TREND_REFRESH_DEBOUNCE, client))
+
+async def _refresh_trends_after(delay, client):
+    """Wait out the debounce delay, then refresh the trend chart on client's page"""
+    try:
+        await asyncio.sleep(delay)
+        if ui_state.refresh_trends:
+            with client:
+                await ui_state.refresh_trends()
+    finally:
+        ui_state.pending_trend_task = None
+
+def paint_trend_button(button, point_id):
+    """Color a card's trend button by whether its point is selected for the trend view"""
+    if point_id in ui_state.selected_points_for_trend:
+        button.props('color=primary')
+    else:
+        button.props(remove='color')
+
 async def toggle_trend_point(point_id):
     """Toggle a point for trend view"""
     if point_id in ui_state.selected_points_for_trend:
@@ -603,50 +1142,62 @@ async def toggle_trend_point(point_id):
     else:
         ui_state.selected_points_for_trend.add(point_id)
     
-    # Refresh dashboard to update button states
-    await refresh_dashboard()
+    # Repaint just this point's trend button and the trends page's list; nothing is refetched
+    refs = ui_state.card_elements.get(point_id, {})
+    if 'trend_button' in refs:
+        paint_trend_button(refs['trend_button'], point_id)
+    
+    if ui_state.update_selected_points_list:
+        await ui_state.update_selected_points_list()
+    
+    # Refresh the trend chart once the clicks settle
+    schedule_trend_refresh()
 
 async def set_point_value(point_id, new_value):
     """Set a new value for a control point"""
+    if not ui_state.connected_websocket:
+        ui.notify("WebSocket not connected", type="negative")
+        return
+    
+    # Show the new value on the card right away, without waiting for the server round-trip
+    refs = ui_state.card_elements.get(point_id)
+    point = ui_state.points_by_id.get(point_id)
+    if refs and point:
+        update_control_card(refs, {**point, 'value': new_value})
+    
     try:
-        if ui_state.connected_websocket:
-            await ui_state.connected_websocket.send(json.dumps({
-                "action": "update_value",
-                "id": point_id,
-                "value": new_value
-            }))
-            ui.notify(f"Value updated for {point_id}", type="positive")
-        else:
-            ui.notify("WebSocket not connected", type="negative")
+        await ui_state.connected_websocket.send(orjson.dumps({
+            "action": "update_value",
+            "id": point_id,
+            "value": new_value
+        }).decode())
+        ui.notify(f"Value updated for {point_id}", type="positive")
     except Exception as e:
+        # Roll the card back to the last value from the server
+        if refs and point:
+            update_control_card(refs, point)
         ui.notify(f"Error updating value: {str(e)}", type="negative")
 
 async def add_control_point(id_input, name_input, desc_input, type_input, unit_input, min_input, max_input, value_input):
     """Add a new control point"""
-    try:
-        new_point = {
-            "id": id_input.value,
-            "name": name_input.value,
-            "description": desc_input.value,
-            "type": type_input.value,
-            "value": value_input.value,
-            "unit": unit_input.value,
-            "min_value": min_input.value,
-            "max_value": max_input.value,
-            "timestamp": datetime.now().isoformat()
-        }
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.post(f'{API_BASE_URL}/control-points', json=new_point)
-        
-        if response.status_code == 200:
-            ui.notify(f"Created new control point: {new_point['name']}", type="positive")
-            clear_point_form()
-            await refresh_dashboard()
-        else:
-            ui.notify(f"Error: {response.text}", type="negative")
-    except Exception as e:
-        ui.notify(f"Error adding control point: {str(e)}", type="negative")
+    new_point = {
+        "id": id_input.value,
+        "name": name_input.value,
+        "description": desc_input.value,
+        "type": type_input.value,
+        "value": value_input.value,
+        "unit": unit_input.value,
+        "min_value": min_input.value,
+        "max_value": max_input.value,
+        "timestamp": datetime.now().isoformat()
+    }
+    
+    if await _call('POST', '/control-points', 'adding control point', json=new_point) is None:
+        return
+    
+    ui.notify(f"Created new control point: {new_point['name']}", type="positive")
+    clear_point_form(id_input, name_input, desc_input, type_input, unit_input, min_input, max_input, value_input)
+    await refresh_dashboard()
 
 def clear_point_form(id_input, name_input, desc_input, type_input, unit_input, min_input, max_input, value_input):
         id_input.set_value("")
@@ -660,74 +1211,76 @@ def clear_point_form(id_input, name_input, desc_input, type_input, unit_input, m
 
 async def edit_control_point(point_id):
     """Edit an existing control point"""
+    response = await _call('GET', f'/control-points/{point_id}', 'editing point')
+    if response is None:
+        return
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f'{API_BASE_URL}/control-points/{point_id}')
-        point = response.json()
+        point = response_json(response)
+    except orjson.JSONDecodeError as e:
+        ui.notify(f"Error editing point: {str(e)}", type="negative")
+        return
+    
+    # Create a dialog for editing
+    with ui.dialog() as dialog, ui.card().classes('w-96'):
+        ui.label(f"Edit Control Point: {point['name']}").classes('text-h6')
         
-        # Create a dialog for editing
-        with ui.dialog() as dialog, ui.card().classes('w-96'):
-            ui.label(f"Edit Control Point: {point['name']}").classes('text-h6')
-            
-            edit_name = ui.input('Name', value=point.get('name', ''))
-            edit_desc = ui.input('Description', value=point.get('description', ''))
-            edit_type = ui.select(['scale', 'actuator'], label='Type', value=point.get('type', 'scale'))
-            edit_unit = ui.input('Unit', value=point.get('unit', ''))
-            edit_min = ui.number('Min Value', value=point.get('min_value'))
-            edit_max = ui.number('Max Value', value=point.get('max_value'))
-            edit_value = ui.number('Current Value', value=point.get('value'))
-            
-            with ui.row().classes('w-full justify-end'):
-                ui.button('Cancel', on_click=dialog.close).props('flat')
-                ui.button('Save', on_click=lambda: save_edited_point(
-                    point_id,
-                    edit_name.value,
-                    edit_desc.value,
-                    edit_type.value,
-                    edit_unit.value,
-                    edit_min.value,
-                    edit_max.value,
-                    edit_value.value,
-                    dialog
-                )).props('color=primary')
+        edit_name = ui.input('Name', value=point.get('name', ''))
+        edit_desc = ui.input('Description', value=point.get('description', ''))
+        edit_type = ui.select(['scale', 'actuator'], label='Type', value=point.get('type', 'scale'))
+        edit_unit = ui.input('Unit', value=point.get('unit', ''))
+        edit_min = ui.number('Min Value', value=point.get('min_value'))
+        edit_max = ui.number('Max Value', value=point.get('max_value'))
+        edit_value = ui.number('Current Value', value=point.get('value'))
         
-        dialog.open()
-    except Exception as e:
-        ui.notify(f"Error editing point: {str(e)}", type="negative")
+        with ui.row().classes('w-full justify-end'):
+            ui.button('Cancel', on_click=dialog.close).props('flat')
+            ui.button('Save', on_click=lambda: save_edited_point(
+                point_id,
+                edit_name.value,
+                edit_desc.value,
+                edit_type.value,
+                edit_unit.value,
+                edit_min.value,
+                edit_max.value,
+                edit_value.value,
+                dialog
+            )).props('color=primary')
+    
+    dialog.open()
 
 async def save_edited_point(point_id, name, desc, point_type, unit, min_val, max_val, value, dialog):
     """Save an edited control point"""
-    try:
-        point = {
-            "id": point_id,
-            "name": name,
-            "description": desc,
-            "type": point_type,
-            "unit": unit,
-            "min_value": min_val,
-            "max_value": max_val,
-            "value": value,
-            "timestamp": datetime.now().isoformat()
-        }
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.put(f'{API_BASE_URL}/control-points/{point_id}', json=point)
-        
-        if response.status_code == 200:
-            dialog.close()
-            ui.notify(f"Point updated: {name}", type="positive")
-            await refresh_dashboard()
-        else:
-            ui.notify(f"Error: {response.text}", type="negative")
-    except Exception as e:
-        ui.notify(f"Error saving point: {str(e)}", type="negative")
+    point = {
+        "id": point_id,
+        "name": name,
+        "description": desc,
+        "type": point_type,
+        "unit": unit,
+        "min_value": min_val,
+        "max_value": max_val,
+        "value": value,
+        "timestamp": datetime.now().isoformat()
+    }
+    
+    if await _call('PUT', f'/control-points/{point_id}', 'saving point', json=point) is None:
+        return
+    
+    dialog.close()
+    ui.notify(f"Point updated: {name}", type="positive")
+    await refresh_dashboard()
 
 async def delete_control_point(point_id):
     """Delete a control point"""
+    # The confirmation arrives outside any slot, so the deletion is run on this page's client
+    client = ui.context.client
+    
+    async def delete_on_page():
+        with client:
+            await delete_point_confirmed(point_id)
+    
     def confirm_delete():
         # Use a non-async wrapper
-        app.on_startup(lambda: asyncio.create_task(delete_point_confirmed(point_id)))
-        return None
+        start_task(delete_on_page())
     
     ui.notify(f"Delete {point_id}?", type="warning", buttons=[
         {'label': 'Cancel', 'color': 'white'},
@@ -736,63 +1289,40 @@ async def delete_control_point(point_id):
 
 async def delete_point_confirmed(point_id):
     """Confirm and delete a control point"""
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.delete(f'{API_BASE_URL}/control-points/{point_id}')
-        
-        if response.status_code == 200:
-            ui.notify(f"Point deleted: {point_id}", type="positive")
-            
-            # Remove from trend selection if present
-            if point_id in ui_state.selected_points_for_trend:
-                ui_state.selected_points_for_trend.remove(point_id)
-            
-            await refresh_dashboard()
-        else:
-            ui.notify(f"Error: {response.text}", type="negative")
-    except Exception as e:
-        ui.notify(f"Error deleting point: {str(e)}", type="negative")
+    if await _call('DELETE', f'/control-points/{point_id}', 'deleting point') is None:
+        return
+    
+    ui.notify(f"Point deleted: {point_id}", type="positive")
+    
+    # Remove from trend selection if present
+    ui_state.selected_points_for_trend.discard(point_id)
+    
+    await refresh_dashboard()
 
 async def create_group(group_id, name, description, points):
     """Create a new control group"""
-    try:
-        new_group = {
-            "id": group_id,
-            "name": name,
-            "description": description,
-            "points": points
-        }
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.post(f'{API_BASE_URL}/control-groups', json=new_group)
-        
-        if response.status_code == 200:
-            ui.notify(f"Created new group: {name}", type="positive")
-            await refresh_config()
-        else:
-            ui.notify(f"Error: {response.text}", type="negative")
-    except Exception as e:
-        ui.notify(f"Error creating group: {str(e)}", type="negative")
+    new_group = {
+        "id": group_id,
+        "name": name,
+        "description": description,
+        "points": points
+    }
+    
+    if await _call('POST', '/control-groups', 'creating group', json=new_group) is not None:
+        ui.notify(f"Created new group: {name}", type="positive")
+        await refresh_config()
 
 async def save_settings(refresh_rate, alarm_notification, data_retention, theme):
     """Save system settings"""
-    try:
-        settings = {
-            "refresh_rate": refresh_rate,
-            "alarm_notification": alarm_notification,
-            "data_retention_days": data_retention,
-            "theme": theme
-        }
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.put(f'{API_BASE_URL}/settings', json=settings)
-        
-        if response.status_code == 200:
-            ui.notify("Settings saved", type="positive")
-        else:
-            ui.notify(f"Error: {response.text}", type="negative")
-    except Exception as e:
-        ui.notify(f"Error saving settings: {str(e)}", type="negative")
+    settings = {
+        "refresh_rate": refresh_rate,
+        "alarm_notification": alarm_notification,
+        "data_retention_days": data_retention,
+        "theme": theme
+    }
+    
+    if await _call('PUT', '/settings', 'saving settings', json=settings) is not None:
+        ui.notify("Settings saved", type="positive")
 
 async def refresh_config():
     """Refresh the configuration page"""
@@ -800,16 +1330,8 @@ async def refresh_config():
 
 async def trigger_simulation():
     """Trigger a simulation of control point values"""
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(f'{API_BASE_URL}/simulate')
-        
-        if response.status_code == 200:
-            ui.notify("Simulation triggered", type="positive")
-        else:
-            ui.notify(f"Error: {response.text}", type="negative")
-    except Exception as e:
-        ui.notify(f"Error triggering simulation: {str(e)}", type="negative")
+    if await _call('POST', '/simulate', 'triggering simulation') is not None:
+        ui.notify("Simulation triggered", type="positive")
 
 async def add_sample_data():
     """Add sample data for demonstration"""
@@ -854,26 +1376,25 @@ async def add_sample_data():
         }
         ]
         
-        for point in sample_points:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(f'{API_BASE_URL}/control-points', json=point)
-        
-        ui.notify("Sample data added", type="positive")
+        # Create every sample point in one request
+        if await _call('POST', '/control-points/bulk', 'adding sample data', json=sample_points) is not None:
+            ui.notify("Sample data added", type="positive")
         await refresh_dashboard()
     except Exception as e:
         ui.notify(f"Error adding sample data: {str(e)}", type="negative")
 
 def create_trend_chart():
-    """Create a chart for trend data"""
+    """Create the trend chart, or update the existing chart with the current trend data"""
     # Prepare data for the chart
     chart_data = []
     
     for point_id, data in ui_state.trend_data.items():
-        if data['timestamps'] and data['values']:
+        if len(data['timestamps']) and len(data['values']):
             # Create dataset for each point
             dataset = {
                 'label': f"{data['label']} ({data['unit']})",
-                'data': [{'x': ts, 'y': val} for ts, val in zip(data['timestamps'], data['values'])],
+                # Chart.js reads [x, y] pairs directly; stacking the columns makes them without any per-sample objects
+                'data': np.column_stack((data['timestamps'], data['values'])),
                 'borderColor': get_random_color(point_id),
                 'tension': 0.1,
                 'fill': False
@@ -881,117 +1402,87 @@ def create_trend_chart():
             chart_data.append(dataset)
     
     if not chart_data:
-        ui.label('No data available for the selected time range').classes('text-center py-8')
+        show_trend_message('No data available for the selected time range')
         return
     
-    # Create chart HTML
-    chart_html = f"""
-    <canvas id="trendChart" style="width: 100%; height: 100%;"></canvas>
-    <script>
-        const ctx = document.getElementById('trendChart').getContext('2d');
-        const chart = new Chart(ctx, {{
-            type: 'line',
-            data: {{
-                datasets: {json.dumps(chart_data)}
-            }},
-            options: {{
-                responsive: true,
-                maintainAspectRatio: false,
-                scales: {{
-                    x: {{
-                        type: 'time',
-                        time: {{
-                            unit: 'minute',
-                            displayFormats: {{
-                                minute: 'HH:mm',
-                                hour: 'HH:mm',
-                                day: 'MMM D'
-                            }}
-                        }},
-                        title: {{
-                            display: true,
-                            text: 'Time'
-                        }}
-                    }},
-                    y: {{
-                        title: {{
-                            display: true,
-                            text: 'Value'
-                        }}
-                    }}
-                }},
-                plugins: {{
-                    legend: {{
-                        position: 'top'
-                    }},
-                    tooltip: {{
-                        mode: 'index',
-                        intersect: false
-                    }}
-                }}
-            }}
-        }});
-    </script>
-    """
+    # Add the canvas once; later refreshes only send the chart its new datasets
+    if ui_state.trend_chart is None:
+        ui_state.chart_container.clear()
+        with ui_state.chart_container:
+            ui_state.trend_chart = ui.html(TREND_CHART_HTML).classes('w-full h-full')
     
-    ui.html(chart_html).classes('w-full h-full')
+    # Run on the chart's own client, since a debounced refresh has no slot for ui.run_javascript to find it from
+    ui_state.chart_container.client.run_javascript(
+        f'window.updateTrendChart({orjson.dumps(chart_data, option=orjson.OPT_SERIALIZE_NUMPY).decode()})'
+    )
+
+def show_trend_message(text, classes='text-center py-8'):
+    """Replace the trend chart with a message"""
+    ui_state.chart_container.clear()
+    ui_state.trend_chart = None
+    with ui_state.chart_container:
+        ui.label(text).classes(classes)
 
+@lru_cache(maxsize=1024)
 def get_random_color(seed):
     """Generate a deterministic color based on a seed string"""
-    # Simple hash function to convert string to number
-    hash_val = sum(ord(c) for c in seed)
-    
-    # Use predefined colors for better aesthetics
-    colors = [
-        'rgb(54, 162, 235)',   # blue
-        'rgb(255, 99, 132)',   # red
-        'rgb(75, 192, 192)',   # green
-        'rgb(255, 159, 64)',   # orange
-        'rgb(153, 102, 255)',  # purple
-        'rgb(255, 205, 86)',   # yellow
-        'rgb(201, 203, 207)',  # grey
-        'rgb(255, 99, 71)',    # tomato
-        'rgb(0, 128, 128)',    # teal
-        'rgb(106, 90, 205)'    # slate blue
-    ]
-    
-    return colors[hash_val % len(colors)]
+    # CRC32 of the seed, so anagrams like "ab" and "ba" don't share a color
+    return _COLORS[zlib.crc32(seed.encode()) % _N_COLORS]
 
 # WebSocket connection
 async def connect_websocket():
-    """Establish WebSocket connection for real-time updates"""
+    """Start listening for real-time updates, unless a listener is already running"""
+    if ui_state.websocket_task and not ui_state.websocket_task.done():
+        return
+    ui_state.websocket_task = start_task(listen_websocket())
+
+def handle_websocket_message(message):
+    """Queue the point changes carried by one raw WebSocket frame"""
+    # The server serializes every message with its "action" key verbatim, so a frame without it
+    # can't be a point change and is skipped without decoding; a false match is decoded and checked below
+    if b'"action"' not in message:
+        return
+    data = orjson.loads(message)
+    # Only point changes are rendered; anything else is skipped
+    action = data.get('action') if isinstance(data, dict) else None
+    if action not in _POINT_ACTIONS:
+        return
+    
+    # Queue pushed changes for the cards; a burst is rendered once
+    if action == 'points_delta':
+        queue_points_delta(data.get('changed', []), data.get('removed', []))
+    elif action in ['create', 'update']:
+        queue_points_delta([data['data']], [])
+    elif action == 'delete':
+        queue_points_delta([], [data['data']['id']])
+
+async def listen_websocket():
+    """Apply real-time updates pushed over the WebSocket, reconnecting with backoff when the connection drops"""
+    ws_url = f'ws://{settings.HOST}:{settings.PORT}/api/ws'
+    
     try:
-        if not ui_state.connected_websocket:
-            
-            ws_url = f'ws://{settings.HOST}:{settings.PORT}/api/ws'
-            
-            ui_state.connected_websocket = await websockets.connect(ws_url)
-            
-            async def listener():
+        # Iterating connect() reconnects with exponential backoff after transient errors
+        async for websocket in websockets.connect(ws_url, ping_interval=20):
+            ui_state.connected_websocket = websocket
+            print("Connected to real-time updates")
+            try:
                 while True:
+                    # Frames are read undecoded, so skipped messages never pay for UTF-8 decoding
+                    message = await websocket.recv(decode=False)
                     try:
-                        message = await ui_state.connected_websocket.recv()
-                        data = json.loads(message)
-                        
-                        if data.get('action') in ['create', 'update', 'delete', 'simulate']:
-                            # Use a JavaScript call to refresh the page instead
-                            await ui.run_javascript('window.location.reload()')
+                        handle_websocket_message(message)
                     except Exception as e:
-                        print(f"WebSocket error: {str(e)}")
-                        break
-                
-                # If we break out of the loop, try to reconnect
+                        print(f"WebSocket message error: {str(e)}")
+            except websockets.ConnectionClosed:
+                print("WebSocket connection closed, reconnecting")
+            except Exception as e:
+                # Drop this connection but keep listening; connect() opens a new one
+                print(f"WebSocket error: {str(e)}, reconnecting")
+            finally:
                 ui_state.connected_websocket = None
-                ui.timer(5.0, connect_websocket)
-            
-            asyncio.create_task(listener())
-            ui.notify("Connected to real-time updates", type="positive")
-        
     except Exception as e:
-        print(f"WebSocket connection error (will retry): {str(e)}")
-        ui_state.connected_websocket = None
-        # Don't overwhelm with connection attempts if server is rejecting
-        ui.timer(10.0, connect_websocket)  # Longer timeout
+        # connect() gives up on errors that retrying won't fix, like a rejected handshake
+        print(f"WebSocket connection error: {str(e)}")
 
 # Main app layout setup
 def setup_layout():
@@ -1023,6 +1514,7 @@ def setup_layout():
         with ui.tab_panel(config_tab):
             create_config_page()
     
-    # Connect WebSocket and initialize dashboard
-    ui.timer(0.1, connect_websocket)
-    ui.timer(0.5, refresh_dashboard)
\ No newline at end of file
+    # Connect WebSocket and load the dashboard; the poll only fills in while the WebSocket is down
+    ui.timer(0.1, connect_websocket, once=True)
+    ui.timer(0.5, refresh_dashboard, once=True)
+    ui.timer(DASHBOARD_POLL_INTERVAL, poll_dashboard)
\ No newline at end of file
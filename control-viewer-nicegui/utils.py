@@ -1,78 +1,76 @@
 """
 Utility functions for the Control Viewer application
 """
-import json
+import orjson
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 import random
 import math
+import numpy as np
 from models import ControlPoint, PointStatus
 
-def json_serial(obj: Any) -> Any:
-    """JSON serializer for objects not serializable by default json code"""
-    if isinstance(obj, datetime):
-        return obj.isoformat()
-    raise TypeError(f"Type {type(obj)} not serializable")
-
 def serialize_to_json(data: Any) -> str:
     """Serialize data to JSON string"""
-    return json.dumps(data, default=json_serial)
+    return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+# Parse JSON string (or bytes) to Python object
+parse_json = orjson.loads
+
+# Sample point types and units
+SAMPLE_POINT_TYPES = ("sensor", "actuator")
+SAMPLE_UNITS = ("°C", "kPa", "L/min", "rpm", "V", "A", "%")
 
-def parse_json(json_str: str) -> Any:
-    """Parse JSON string to Python object"""
-    return json.loads(json_str)
+# Per-unit columns for sample data, indexed like SAMPLE_UNITS: the point's range,
+# the range sample values are drawn from, and the decimals they're rounded to
+_SAMPLE_MIN = np.array([0, 0, 0, 0, 0, 0, 0], dtype=np.float64)
+_SAMPLE_MAX = np.array([100, 1000, 200, 3000, 240, 100, 100], dtype=np.float64)
+_SAMPLE_LOW = np.array([15, 100, 10, 500, 110, 5, 0], dtype=np.float64)
+_SAMPLE_HIGH = np.array([30, 500, 100, 2000, 230, 20, 100], dtype=np.float64)
+_SAMPLE_SCALE = 10.0 ** np.array([1, 1, 1, 0, 1, 2, 1])
+
+# Statuses indexed by the codes generate_sample_data computes
+_SAMPLE_STATUSES = (PointStatus.NORMAL, PointStatus.WARNING, PointStatus.ALARM)
+
+_rng = np.random.default_rng()
 
 def generate_sample_data(num_points: int = 10) -> List[ControlPoint]:
     """Generate sample control points for testing"""
-    point_types = ["sensor", "actuator"]
-    units = ["°C", "kPa", "L/min", "rpm", "V", "A", "%"]
+    type_idx = _rng.integers(0, len(SAMPLE_POINT_TYPES), num_points)
+    unit_idx = _rng.integers(0, len(SAMPLE_UNITS), num_points)
+    
+    # Draw every value in one batch from its unit's range, rounded to the unit's precision
+    min_vals = _SAMPLE_MIN[unit_idx]
+    max_vals = _SAMPLE_MAX[unit_idx]
+    scale = _SAMPLE_SCALE[unit_idx]
+    values = np.round(_rng.uniform(_SAMPLE_LOW[unit_idx], _SAMPLE_HIGH[unit_idx]) * scale) / scale
+    
+    # Determine status based on value
+    range_size = max_vals - min_vals
+    warning = (values < min_vals + range_size * 0.1) | (values > max_vals - range_size * 0.1)
+    alarm = (values < min_vals + range_size * 0.05) | (values > max_vals - range_size * 0.05)
+    # The alarm band is the tighter one, so it's checked first
+    status_idx = np.select([alarm, warning], [2, 1], default=0)
+    
+    # Every sample point gets the same timestamp, from a single clock read
+    now = datetime.now()
     
     points = []
-    for i in range(num_points):
-        point_type = random.choice(point_types)
-        unit = random.choice(units)
-        
-        # Create different ranges based on unit
-        if unit == "°C":
-            min_val, max_val = 0, 100
-            value = round(random.uniform(15, 30), 1)
-        elif unit == "kPa":
-            min_val, max_val = 0, 1000
-            value = round(random.uniform(100, 500), 1)
-        elif unit == "L/min":
-            min_val, max_val = 0, 200
-            value = round(random.uniform(10, 100), 1)
-        elif unit == "rpm":
-            min_val, max_val = 0, 3000
-            value = round(random.uniform(500, 2000), 0)
-        elif unit == "V":
-            min_val, max_val = 0, 240
-            value = round(random.uniform(110, 230), 1)
-        elif unit == "A":
-            min_val, max_val = 0, 100
-            value = round(random.uniform(5, 20), 2)
-        else:  # %
-            min_val, max_val = 0, 100
-            value = round(random.uniform(0, 100), 1)
-        
-        # Determine status based on value
-        if value < min_val + (max_val - min_val) * 0.1 or value > max_val - (max_val - min_val) * 0.1:
-            status = PointStatus.WARNING
-        elif value < min_val + (max_val - min_val) * 0.05 or value > max_val - (max_val - min_val) * 0.05:
-            status = PointStatus.ALARM
-        else:
-            status = PointStatus.NORMAL
-            
+    for i, (t, u, value, min_val, max_val, s) in enumerate(zip(
+        type_idx.tolist(), unit_idx.tolist(), values.tolist(),
+        min_vals.tolist(), max_vals.tolist(), status_idx.tolist()
+    )):
+        point_type = SAMPLE_POINT_TYPES[t]
         point = ControlPoint(
             id=f"{point_type[:1]}-{i+1:02d}",
             name=f"{point_type.capitalize()} {i+1}",
             description=f"Sample {point_type} point #{i+1}",
             value=value,
-            unit=unit,
+            unit=SAMPLE_UNITS[u],
             min_value=min_val,
             max_value=max_val,
-            timestamp=datetime.now(),
-            status=status,
+            timestamp=now,
+            status=_SAMPLE_STATUSES[s],
             type=point_type
         )
         
@@ -80,6 +78,28 @@ def generate_sample_data(num_points: int = 10) -> List[ControlPoint]:
     
     return points
 
+# Half-width of the uniform variation added to a simulated value each step, by unit
+_NOISE_WIDTH = {"°C": 0.5, "kPa": 10, "L/min": 2, "rpm": 50, "%": 2}
+_DEFAULT_NOISE_WIDTH = 5
+
+# Decimals simulated values are rounded to, by unit
+_SIMULATED_DECIMALS = {"°C": 1, "V": 1, "kPa": 1, "L/min": 1, "%": 1, "A": 2}
+
+# Simulation noise is drawn in bulk as uniform samples in [-1, 1) and scaled per unit
+NOISE_BUFFER_SIZE = 4096
+_noise = _rng.uniform(-1, 1, NOISE_BUFFER_SIZE).tolist()
+_noise_pos = 0
+
+def _next_noise() -> float:
+    """Take the next uniform [-1, 1) sample from the noise buffer, refilling it when exhausted"""
+    global _noise, _noise_pos
+    if _noise_pos == NOISE_BUFFER_SIZE:
+        _noise = _rng.uniform(-1, 1, NOISE_BUFFER_SIZE).tolist()
+        _noise_pos = 0
+    sample = _noise[_noise_pos]
+    _noise_pos += 1
+    return sample
+
 def generate_simulated_value(point: ControlPoint) -> float:
     """Generate a simulated value for a control point based on its previous value"""
     if point.value is None:
@@ -91,22 +111,8 @@ def generate_simulated_value(point: ControlPoint) -> float:
             return round(random.uniform(0, 100), 2)
     
     # Generate new value based on previous value
-    # Add some random variation but keep within bounds
-    variation = random.uniform(-5, 5)
-    
-    # More realistic variation based on the unit
-    if point.unit == "°C":
-        variation = random.uniform(-0.5, 0.5)
-    elif point.unit == "kPa":
-        variation = random.uniform(-10, 10)
-    elif point.unit == "L/min":
-        variation = random.uniform(-2, 2)
-    elif point.unit == "rpm":
-        variation = random.uniform(-50, 50)
-    elif point.unit == "%":
-        variation = random.uniform(-2, 2)
-    
-    new_value = point.value + variation
+    # Add some random variation, more realistic based on the unit, but keep within bounds
+    new_value = point.value + _next_noise() * _NOISE_WIDTH.get(point.unit, _DEFAULT_NOISE_WIDTH)
     
     # Keep within bounds if specified
     if point.min_value is not None:
@@ -115,37 +121,51 @@ def generate_simulated_value(point: ControlPoint) -> float:
         new_value = min(point.max_value, new_value)
     
     # Round to appropriate precision
-    if point.unit in ["°C", "V", "kPa", "L/min", "%"]:
-        new_value = round(new_value, 1)
-    elif point.unit in ["A"]:
-        new_value = round(new_value, 2)
-    else:
-        new_value = round(new_value, 0)
+    return round(new_value, _SIMULATED_DECIMALS.get(point.unit, 0))
+
+# Statuses indexed by how many of the error, alarm and warning bands a value falls in
+_STATUS_TABLE = (PointStatus.NORMAL, PointStatus.WARNING, PointStatus.ALARM, PointStatus.ERROR)
+
+@lru_cache(maxsize=1024)
+def _status_thresholds(min_value: float, max_value: float) -> tuple:
+    """Alarm and warning thresholds for a range, as (alarm_low, alarm_high, warn_low, warn_high)"""
+    if max_value <= min_value:
+        # Every value is out of an empty or inverted range, so put it in every band
+        return (math.inf, -math.inf, math.inf, -math.inf)
+    
+    range_size = max_value - min_value
     
-    return new_value
+    # Alarm threshold: within 5% of min or max; warning threshold: within 10% of min or max
+    return (
+        min_value + range_size * 0.05,
+        max_value - range_size * 0.05,
+        min_value + range_size * 0.1,
+        max_value - range_size * 0.1,
+    )
 
 def calculate_status(point: ControlPoint) -> PointStatus:
     """Calculate the status of a control point based on its value and limits"""
     if point.value is None or point.min_value is None or point.max_value is None:
         return PointStatus.UNKNOWN
     
-    range_size = point.max_value - point.min_value
-    
-    # Warning threshold: within 10% of min or max
-    warn_low = point.min_value + range_size * 0.1
-    warn_high = point.max_value - range_size * 0.1
+    v = point.value
+    alarm_low, alarm_high, warn_low, warn_high = _status_thresholds(point.min_value, point.max_value)
     
-    # Alarm threshold: within 5% of min or max
-    alarm_low = point.min_value + range_size * 0.05
-    alarm_high = point.max_value - range_size * 0.05
-    
-    if point.value <= point.min_value or point.value >= point.max_value:
-        return PointStatus.ERROR
-    
-    if point.value <= alarm_low or point.value >= alarm_high:
-        return PointStatus.ALARM
+    # The bands are nested, so a value in the error band is also in the alarm and warning bands
+    s = (v <= point.min_value) | (v >= point.max_value)
+    s += (v <= alarm_low) | (v >= alarm_high)
+    s += (v <= warn_low) | (v >= warn_high)
+    return _STATUS_TABLE[s]
+
+def calculate_status_batch(values: np.ndarray, mins: np.ndarray, maxs: np.ndarray) -> List[PointStatus]:
+    """Calculate the statuses of many control points at once from arrays of values and limits"""
+    values, mins, maxs = np.asarray(values), np.asarray(mins), np.asarray(maxs)
+    range_size = maxs - mins
     
-    if point.value <= warn_low or point.value >= warn_high:
-        return PointStatus.WARNING
+    error = (values <= mins) | (values >= maxs)
+    alarm = (values <= mins + range_size * 0.05) | (values >= maxs - range_size * 0.05)
+    warning = (values <= mins + range_size * 0.1) | (values >= maxs - range_size * 0.1)
     
-    return PointStatus.NORMAL
\ No newline at end of file
+    # An empty or inverted range puts every value in the error band
+    codes = np.where(range_size > 0, error.astype(np.int8) + alarm + warning, 3)
+    return [_STATUS_TABLE[code] for code in codes.tolist()]